@@ -1,8 +1,17 @@
+import yaml
 from pathlib import Path
 from typing import Dict, Generic, TypeVar, Optional
 
 T = TypeVar("T")
 
+# libyaml's C parser when PyYAML was built with it, otherwise the pure-Python safe loader
+YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def load_yaml(stream):
+    """Parse a YAML document with the fastest available safe loader."""
+    return yaml.load(stream, Loader=YamlLoader)
+
 
 class BaseSpecReader(Generic[T]):
     """
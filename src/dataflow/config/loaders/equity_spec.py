@@ -1,7 +1,6 @@
-import yaml
 from dataclasses import dataclass, field
 from typing import List, Optional, Dict
-from dataflow.config.loaders.base import BaseSpecReader
+from dataflow.config.loaders.base import BaseSpecReader, load_yaml
 
 
 @dataclass
@@ -24,7 +23,7 @@ class EquitySpecReader(BaseSpecReader):
 
     def _load_config(self) -> Dict[str, EquitySpec]:
         with open(self.config_path, "r", encoding="utf-8") as f:
-            raw_data = yaml.safe_load(f) or {}
+            raw_data = load_yaml(f) or {}
 
         equity_spec_data = raw_data["equity_spec"] or {}
         specs: Dict[str, EquitySpec] = {}
@@ -1,10 +1,9 @@
 from zoneinfo import ZoneInfo
-import yaml
 import datetime as dt
 from pathlib import Path
 from dataclasses import dataclass
 from typing import Dict, List, Optional
-from dataflow.config.loaders.base import BaseSpecReader
+from dataflow.config.loaders.base import BaseSpecReader, load_yaml
 
 @dataclass
 class FuturesOptSpec:
@@ -40,7 +39,7 @@ class FuturesOptSpecReader(BaseSpecReader):
             raise FileNotFoundError(f"Configuration file not found: {self.config_path}")
 
         with open(self.config_path, 'r') as f:
-            self.raw_data = yaml.safe_load(f)
+            self.raw_data = load_yaml(f)
 
         fut_option_spec_data = self.raw_data["futures_option_spec"] or {}
         specs: Dict[str, FuturesOptSpec] = {}
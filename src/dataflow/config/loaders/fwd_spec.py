@@ -1,7 +1,6 @@
-import yaml
 from dataclasses import dataclass, field
 from typing import List, Optional, Dict
-from dataflow.config.loaders.base import BaseSpecReader
+from dataflow.config.loaders.base import BaseSpecReader, load_yaml
 
 
 @dataclass
@@ -26,7 +25,7 @@ class ForwardSpecReader(BaseSpecReader):
 
     def _load_config(self) -> Dict[str, ForwardSpec]:
         with open(self.config_path, "r", encoding="utf-8") as f:
-            self.raw_data = yaml.safe_load(f) or {}
+            self.raw_data = load_yaml(f) or {}
 
         if "forward_spec" not in self.raw_data:
             raise ValueError("YAML must contain a top-level 'forward_spec' key")
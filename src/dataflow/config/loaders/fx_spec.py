@@ -1,8 +1,7 @@
-import yaml
 from pathlib import Path
 from dataclasses import dataclass, field
 from typing import List, Optional, Dict
-from dataflow.config.loaders.base import BaseSpecReader
+from dataflow.config.loaders.base import BaseSpecReader, load_yaml
 
 
 @dataclass
@@ -25,7 +24,7 @@ class FxSpecReader(BaseSpecReader):
 
     def _load_config(self) -> Dict[str, FxSpec]:
         with open(self.config_path, "r", encoding="utf-8") as f:
-            self.raw_data = yaml.safe_load(f) or {}
+            self.raw_data = load_yaml(f) or {}
 
         if "fx_spec" not in self.raw_data :
             raise ValueError("YAML must contain a top-level 'fx_spec' key")
@@ -1,8 +1,7 @@
-import yaml
 from pathlib import Path
 from dataclasses import dataclass, field
 from typing import List, Optional, Dict
-from dataflow.config.loaders.base import BaseSpecReader
+from dataflow.config.loaders.base import BaseSpecReader, load_yaml
 
 
 @dataclass
@@ -30,7 +29,7 @@ class IndexSpecReader(BaseSpecReader):
 
     def _load_config(self) -> Dict[str, IndexSpec]:
         with open(self.config_path, "r", encoding="utf-8") as f:
-            self.raw_data = yaml.safe_load(f)
+            self.raw_data = load_yaml(f)
 
         if "index_spec" not in self.raw_data:
             raise ValueError("YAML must contain a top-level 'index_spec' key")
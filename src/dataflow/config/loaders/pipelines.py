@@ -1,8 +1,7 @@
-import yaml
 import json
 from pathlib import Path
 from typing import List, Dict, Any
-from dataflow.config.loaders.base import BaseSpecReader
+from dataflow.config.loaders.base import BaseSpecReader, load_yaml
 
 
 class Pipeline:
@@ -78,7 +77,7 @@ class PipelineSpecReader(BaseSpecReader):
     def _load_config(self) -> Dict[str, List[Pipeline]]:
         """Load and parse the YAML configuration file."""
         with open(self.config_path, "r", encoding="utf-8") as f:
-            self.raw_data = yaml.safe_load(f)
+            self.raw_data = load_yaml(f)
 
         if "root_ids" not in self.raw_data:
             raise ValueError("YAML must contain a top-level 'root_ids' key")
@@ -1,8 +1,7 @@
-import yaml
 from dataclasses import dataclass, field
 from typing import List, Optional, Dict, Any
 
-from dataflow.config.loaders.base import BaseSpecReader
+from dataflow.config.loaders.base import BaseSpecReader, load_yaml
 
 
 @dataclass
@@ -26,7 +25,7 @@ class SpreadSpecReader(BaseSpecReader[SpreadSpec]):
 
     def _load_config(self) -> Dict[str, SpreadSpec]:
         with open(self.config_path, "r", encoding="utf-8") as f:
-            self.raw_data = yaml.safe_load(f) or {}
+            self.raw_data = load_yaml(f) or {}
 
         if "spread_spec" not in self.raw_data:
             raise ValueError("YAML must contain a top-level 'spread_spec' key")
@@ -1,5 +1,6 @@
 import json
 from typing import Any
+from functools import cached_property
 from pydantic import BaseModel, Field, field_validator, computed_field
 
 from datacore.models.assets import BaseAsset
@@ -60,6 +61,11 @@ class TimeSeriesConfig(BaseModel):
             raise ValueError("Invalid destination type")
         return output_type
 
+    @cached_property
+    def destination_str(self) -> str:
+        """Destinations joined for display, computed once per config."""
+        return ", ".join(self.destination)
+
     @computed_field
     @property
     def description(self) -> str:
@@ -75,8 +81,7 @@ class TimeSeriesConfig(BaseModel):
             f"{self.data_source}",
             f"schema:{self.data_schema.value}"
         ]
-        dest_str = ", ".join(self.destination)
-        parts.append(f"to:{dest_str}")
+        parts.append(f"to:{self.destination_str}")
         return " | ".join(parts)
 
     def __str__(self) -> str:
@@ -152,6 +152,11 @@ class Settings(BaseSettings):
     onyx_url: Optional[str]
     sparta_api_key: Optional[str]
     bpipe_app_name: Optional[str]
+    bpipe_rps: float
+
+    # Symbology Cache
+    symbol_cache_path: Optional[str]
+    symbol_cache_ttl_hours: int
 
     model_config = SettingsConfigDict(
         env_file=[Path(__file__).resolve().parent / '.env.common', Path(__file__).resolve().parent / '.env'],
@@ -5,11 +5,22 @@ import yaml
 import logging
 from pathlib import Path
 
-from dataflow.utils.yaml_to_html import time_series_html
+from dataflow.utils.yaml_to_html import TEMPLATE_DIR, time_series_html
 from dataflow.config.loaders.manager import gen_all_spec
 
 logger = logging.getLogger(__name__)
 
+HTML_OUTPUT = Path("./time_series.html")
+
+# Files the dashboard is built from, it is only regenerated when one of them is newer than the output
+_CONFIG_DIR = Path(__file__).resolve().parent
+DASHBOARD_INPUTS = (
+    (_CONFIG_DIR / "specs", "*.yaml"),
+    (_CONFIG_DIR / "loaders", "*.py"),
+    (TEMPLATE_DIR, "*"),
+    (TEMPLATE_DIR.parent, "yaml_to_html.py"),
+)
+
 
 def parse_arguments(args):
     parser = argparse.ArgumentParser()
@@ -22,17 +33,41 @@ def parse_arguments(args):
         "--generate-html",
         action="store_true"
     )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Regenerate the HTML dashboard even if it is newer than its inputs",
+    )
     args = parser.parse_args(args)
     return args
 
 
+def html_up_to_date(output_path: Path) -> bool:
+    """Return True when output_path exists and is newer than every dashboard input file."""
+    if not output_path.exists():
+        return False
+    built = output_path.stat().st_mtime
+    return all(
+        path.stat().st_mtime <= built
+        for directory, pattern in DASHBOARD_INPUTS
+        for path in directory.glob(pattern)
+    )
+
+
 def main(args):
     args = parse_arguments(args)
+    generate_html = args.generate_html
+    if generate_html and not args.force and html_up_to_date(HTML_OUTPUT):
+        logger.info(f"{HTML_OUTPUT} is up to date, skipping dashboard generation")
+        generate_html = False
+    if not (args.serialization or generate_html):
+        return
+
     time_series = gen_all_spec()
     if args.serialization:
         serialization(time_series, output_type=args.serialization)
-    if args.generate_html:
-        time_series_html(time_series, output_path=Path("./time_series.html"))
+    if generate_html:
+        time_series_html(time_series, output_path=HTML_OUTPUT)
 
 
 def serialization(time_series, output_type: str):
@@ -12,7 +12,7 @@ from dataflow.config.settings import settings
 from dataflow.utils.common import parse_web_response
 from dataflow.utils.loop_control import RuntimeControl
 from dataflow.config.loaders.time_series import TimeSeriesConfig
-from dataflow.symbology.bbg_resolver import bbg_symbol_resolver
+from dataflow.symbology.bbg_resolver import get_bbg_symbol_resolver
 from dataflow.extractors.historical.base_historical import BaseHistoricalExtractor
 
 
@@ -57,7 +57,7 @@ class BBGHistoricalExtractor(BaseHistoricalExtractor):
 
             all_futures = list(underlyings.keys())
 
-            all_options = bbg_symbol_resolver.resolve(input_symbols=all_futures, market="LME", resolve_type=AssetType.FUT_OPTION)
+            all_options = get_bbg_symbol_resolver().resolve(input_symbols=all_futures, market="LME", resolve_type=AssetType.FUT_OPTION)
             for series_id, option_symbols in all_options.items():
                 data = self.extract_price(option_symbols)
                 self.on_message(data, underlyings[series_id])
@@ -9,7 +9,7 @@ from dataflow.config.settings import settings
 from dataflow.utils.databento import VENUE_DATASET_MAP
 from dataflow.utils.loop_control import RuntimeControl
 from dataflow.config.loaders.time_series import TimeSeriesConfig
-from dataflow.symbology.databento_resolver import db_symbol_resolver
+from dataflow.symbology.databento_resolver import get_db_symbol_resolver
 from dataflow.extractors.realtime.base_realtime import BaseRealtimeExtractor
 
 logger = logging.getLogger(__name__)
@@ -99,7 +99,7 @@ class DatabentoRealtimeExtractor(BaseRealtimeExtractor):
             dflow_id_in_dataset = []
             for schema, all_ts in schema_to_ts.items():
                 dflow_id_in_dataset.extend([ts.asset.dflow_id for ts in all_ts])
-            mapping.update(db_symbol_resolver.resolve(dflow_id_in_dataset, data_set))
+            mapping.update(get_db_symbol_resolver().resolve(dflow_id_in_dataset, data_set))
         for ts in self.time_series:
             ts.asset.symbol = mapping.get(ts.asset.dflow_id, ts.asset.symbol)
 
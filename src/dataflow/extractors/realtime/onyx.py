@@ -9,7 +9,7 @@ from dataflow.config.settings import settings
 from dataflow.utils.common import parse_web_response
 from dataflow.utils.loop_control import RuntimeControl
 from dataflow.config.loaders.time_series import TimeSeriesConfig
-from dataflow.symbology.onyx_resolver import onyx_symbol_resolver
+from dataflow.symbology.onyx_resolver import get_onyx_symbol_resolver
 from dataflow.extractors.realtime.base_realtime import BaseRealtimeExtractor
 
 logger = logging.getLogger(__name__)
@@ -52,7 +52,7 @@ class OnyxRealtimeExtractor(BaseRealtimeExtractor):
 
     def resolve_raw_symbols(self):
         series_ids = [s.series_id for s in self.time_series]
-        series_id_to_raw_symbol = onyx_symbol_resolver.resolve(series_ids)
+        series_id_to_raw_symbol = get_onyx_symbol_resolver().resolve(series_ids)
         for s in self.time_series:
             if s.series_id in series_id_to_raw_symbol:
                 s.symbol = series_id_to_raw_symbol[s.series_id]
@@ -14,6 +14,7 @@ from tradetools import DEFAULT_TIMEZONE
 from tradetools.common import parse_time, print_args
 
 from dataflow.utils.common import set_env_vars
+from dataflow.services.orchestrator import ServiceOrchestrator
 from dataflow.config.loaders.manager import time_series_config
 
 
@@ -149,7 +150,6 @@ def main(args):
     }
 
     print_args(args, extra_params=service_config)
-    from dataflow.services.orchestrator import ServiceOrchestrator
     with ServiceOrchestrator(service_type="historical", service_config=service_config) as so:
         so.run_services()
 
@@ -1,6 +1,7 @@
 import copy
 import logging
-from collections import defaultdict
+from itertools import groupby
+from operator import attrgetter
 
 from dataflow.extractors.extractor_factory import ExtractorFactory
 
@@ -25,18 +26,14 @@ class ServiceOrchestrator:
             logger.warning("No time series configurations found")
             return
 
-        grouped_services = defaultdict(list)
-        for time_series in self.service_config["time_series"]:
-            extractor_type = time_series.extractor
-            data_source = time_series.data_source
-            group_key = (extractor_type, data_source)
-            grouped_services[group_key].append(time_series)
+        # Sort once on (extractor, data_source) so groups come out in a deterministic order
+        group_key = attrgetter("extractor", "data_source")
+        sorted_time_series = sorted(self.service_config["time_series"], key=group_key)
 
-        for group_key, all_time_series in grouped_services.items():
-            extractor_type, data_source = group_key
+        for (extractor_type, data_source), all_time_series in groupby(sorted_time_series, key=group_key):
             extractor_cls = ExtractorFactory.create_extractor(extractor_type, data_source)
             service_config = copy.deepcopy(self.service_config)
-            service_config["time_series"] = all_time_series
+            service_config["time_series"] = list(all_time_series)
             extractor = extractor_cls(config=service_config)
             self.services.append(extractor)
 
@@ -4,17 +4,12 @@ import logging
 import argparse
 import datetime as dt
 from functools import partial
-from pyarrow import logging_memory_pool
-
-from datacore.models.mktdata.venue import Venue
-from datacore.models.assets.asset_type import AssetType
-from datacore.models.mktdata.datasource import DataSource
 
 from tradetools import DEFAULT_TIMEZONE
 from tradetools.common import parse_time, print_args
 
 from dataflow.utils.common import set_env_vars
-from dataflow.config.loaders.manager import time_series_config
+from dataflow.services.orchestrator import ServiceOrchestrator
 
 
 logging.basicConfig(
@@ -25,6 +20,22 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+# datacore enums are resolved lazily so that --help does not pay for importing the models
+def parse_venue(value: str):
+    from datacore.models.mktdata.venue import Venue
+    return Venue(value)
+
+
+def parse_asset_type(value: str):
+    from datacore.models.assets.asset_type import AssetType
+    return AssetType(value)
+
+
+def parse_data_source(value: str):
+    from datacore.models.mktdata.datasource import DataSource
+    return DataSource(value)
+
+
 def parse_arguments(args):
     parser = argparse.ArgumentParser()
 
@@ -51,21 +62,21 @@ def parse_arguments(args):
 
     parser.add_argument(
         "--venue",
-        type=Venue,
+        type=parse_venue,
         required=True,
         help="venue"
     )
 
     parser.add_argument(
         "--asset-type",
-        type=AssetType,
+        type=parse_asset_type,
         required=True,
         help="asset type"
     )
 
     parser.add_argument(
         "--data-source",
-        type=DataSource,
+        type=parse_data_source,
         required=True,
         help="data source"
     )
@@ -106,6 +117,9 @@ def parse_arguments(args):
 def main(args):
     args = parse_arguments(args)
 
+    # Building the time series config loads every spec, only do it once arguments are valid
+    from dataflow.config.loaders.manager import time_series_config
+
     asset_ts = (
         time_series_config.get_realtime_ts()
         .get_ts_by_venue(args.venue)
@@ -129,7 +143,6 @@ def main(args):
     }
 
     print_args(args, extra_params=service_config)
-    from dataflow.services.orchestrator import ServiceOrchestrator
     with ServiceOrchestrator(service_type="realtime", service_config=service_config) as so:
         so.run_services()
 
@@ -2,7 +2,8 @@ from abc import ABC, abstractmethod
 
 
 class BaseSymbolResolver(ABC):
+    __slots__ = ()
 
     @abstractmethod
-    def resolve(self, *args):
+    def resolve(self, input_symbols: list[str], *args, **kwargs) -> dict:
         pass
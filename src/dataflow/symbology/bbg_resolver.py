@@ -1,67 +1,87 @@
-import time
 import logging
-from bamdata import bloomberg
-from bamdata.api import get
+from functools import lru_cache
 
 from datacore.models.assets import AssetType
 from dataflow.config.settings import settings
-from dataflow.utils.bbg import DATAFLOW_ID_TO_BBG, BBG_SYMBOL_SPEC
+from dataflow.utils.bbg import DATAFLOW_ID_SPEC, group_option_chain
+from dataflow.utils.rate_limit import RateLimiter
 from dataflow.symbology.base import BaseSymbolResolver
+from dataflow.symbology.cache import cached_resolution
 
-bloomberg.FORCE_DELAY_REPOS = set()
 logger = logging.getLogger(__name__)
 
+BPIPE_AUTH = dict(Type='App', Name=settings.bpipe_app_name)
+
 
 class BBGSymbolResolver(BaseSymbolResolver):
-    def resolve(self, input_symbols: list[str], market: str, resolve_type: str) -> dict[str, str]:
-        if market == "LME" and resolve_type == AssetType.FUT:
-            mapping = self.resolve_lme_futures(input_symbols)
-        elif market == "LME" and resolve_type == AssetType.FUT_OPTION:
-            mapping = self.resolve_lme_futures_option(input_symbols)
-        else:
-            mapping = {}
-        return mapping
+    __slots__ = ("_get", "_limiter")
 
-    def resolve_lme_futures(self, symbols: list[str]) -> dict[str, str]:
-        futures_mapping = {}
-        all_futures = []
-        for sym in symbols:
-            venue, fut_root, term = sym.split('.')
-            dataflow_fut_root = f"{venue}.{fut_root}"
-            bbg_future = DATAFLOW_ID_TO_BBG[dataflow_fut_root] + str(term) + BBG_SYMBOL_SPEC[DATAFLOW_ID_TO_BBG[dataflow_fut_root]]["suffix"]
-            all_futures.append(bbg_future)
+    # (market, resolve_type) -> resolver method name
+    DISPATCH = {
+        ("LME", AssetType.FUT): "resolve_lme_futures",
+        ("LME", AssetType.FUT_OPTION): "resolve_lme_futures_option",
+    }
+
+    def __init__(self):
+        # bamdata is heavy to import, defer it until a resolver is actually needed
+        from bamdata import bloomberg
+        from bamdata.api import get
 
-        bbg_fut_mapping = get(
+        bloomberg.FORCE_DELAY_REPOS = set()
+        self._get = get
+        self._limiter = RateLimiter(rate=settings.bpipe_rps)
+
+    def reference_data(self, ids: list[str], fields: list[str]):
+        self._limiter.acquire()
+        return self._get(
             "BloombergApi.BloombergReferenceData",
-            Auth=dict(Type='App', Name=settings.bpipe_app_name),
-            Symbols=dict(Symbology="ticker", IDs=all_futures),
-            Fields=['FUT_CUR_GEN_TICKER']
+            Auth=BPIPE_AUTH,
+            Symbols=dict(Symbology="ticker", IDs=ids),
+            Fields=fields
         )
-        bbg_fut_mapping = dict(zip(bbg_fut_mapping["SYMBOL"], bbg_fut_mapping["FUT_CUR_GEN_TICKER"]))
 
+    @cached_resolution
+    def resolve(self, input_symbols: list[str], market: str, resolve_type: str) -> dict:
+        method_name = self.DISPATCH.get((market, resolve_type))
+        if method_name is None:
+            logger.error(f"{market} {resolve_type} resolver not implemented")
+            return {}
+        return getattr(self, method_name)(input_symbols)
+
+    def resolve_lme_futures(self, symbols: list[str]) -> dict[str, str]:
+        # (dataflow symbol, bbg suffix, bbg generic future), parsed once per symbol
+        parsed = []
         for sym in symbols:
             venue, fut_root, term = sym.split('.')
-            dataflow_fut_root = f"{venue}.{fut_root}"
-            bbg_future = DATAFLOW_ID_TO_BBG[dataflow_fut_root] + str(term) + \
-                         BBG_SYMBOL_SPEC[DATAFLOW_ID_TO_BBG[dataflow_fut_root]]["suffix"]
-            bbg_id = bbg_fut_mapping[bbg_future] + BBG_SYMBOL_SPEC[DATAFLOW_ID_TO_BBG[dataflow_fut_root]]["suffix"]
+            bbg_root, suffix, _ = DATAFLOW_ID_SPEC[f"{venue}.{fut_root}"]
+            parsed.append((sym, suffix, f"{bbg_root}{term}{suffix}"))
+
+        bbg_fut_mapping = self.reference_data([bbg_future for _, _, bbg_future in parsed], ['FUT_CUR_GEN_TICKER'])
+        bbg_fut_mapping = dict(zip(bbg_fut_mapping["SYMBOL"], bbg_fut_mapping["FUT_CUR_GEN_TICKER"]))
+
+        futures_mapping = {}
+        for sym, suffix, bbg_future in parsed:
+            cur_gen_ticker = bbg_fut_mapping[bbg_future]
+            if cur_gen_ticker.endswith(suffix):
+                logger.warning(f"FUT_CUR_GEN_TICKER for {bbg_future} already carries suffix: {cur_gen_ticker}")
+                bbg_id = cur_gen_ticker
+            else:
+                bbg_id = cur_gen_ticker + suffix
             futures_mapping[sym] = bbg_id
             logger.info(f"contract mapping {sym} -> {bbg_id}")
         return futures_mapping
 
-    def resolve_lme_futures_option(self, symbols: list[str]) -> dict[str, str]:
+    def resolve_lme_futures_option(self, symbols: list[str]) -> dict[str, list[str]]:
         futures_mapping = self.resolve_lme_futures(symbols)
+
+        # One bulk OPT_CHAIN request for every future, rows are keyed back by SYMBOL
+        bbg_ids = list(futures_mapping.values())
+        chains = group_option_chain(self.reference_data(bbg_ids, ['OPT_CHAIN']), bbg_ids)
+
         options_mapping = {}
         for dataflow_id, bbg_id in futures_mapping.items():
-            opt_chain = get(
-                "BloombergApi.BloombergReferenceData",
-                Auth=dict(Type='App', Name=settings.bpipe_app_name),
-                Symbols=dict(Symbology="ticker", IDs=bbg_id),
-                Fields=['OPT_CHAIN']
-            )
-            logger.info(f"Got {len(opt_chain)} options for {bbg_id}")
-            options_mapping[dataflow_id] = [" ".join(ticker.split()) for ticker in list(opt_chain['SECURITY_DESCRIPTION'])]
-            time.sleep(5)
+            options_mapping[dataflow_id] = chains[bbg_id]
+            logger.info(f"Got {len(options_mapping[dataflow_id])} options for {bbg_id}")
         return options_mapping
 
     def resolve_cme_futures(self, symbols: list[str]) -> dict[str, str]:
@@ -71,4 +91,6 @@ class BBGSymbolResolver(BaseSymbolResolver):
         pass
 
 
-bbg_symbol_resolver = BBGSymbolResolver()
\ No newline at end of file
+@lru_cache(maxsize=1)
+def get_bbg_symbol_resolver() -> BBGSymbolResolver:
+    return BBGSymbolResolver()
\ No newline at end of file
@@ -0,0 +1,120 @@
+import json
+import time
+import sqlite3
+import hashlib
+import logging
+import threading
+import datetime as dt
+from pathlib import Path
+from typing import Optional
+from functools import lru_cache, wraps
+
+from dataflow.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# bump whenever the stored payload layout changes so stale rows are never decoded
+CACHE_VERSION = 3
+
+
+class SymbolCache:
+    """
+    SQLite-backed store for symbol resolution results, shared by all resolvers.
+    Entries are keyed by resolver, calendar date and inputs, and expire after `ttl_seconds`.
+    Expired rows are purged when the cache is opened.
+    """
+
+    def __init__(self, path: Path, ttl_seconds: float):
+        self.path = Path(path).expanduser()
+        self.ttl_seconds = ttl_seconds
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS symbol_cache (key TEXT PRIMARY KEY, value TEXT NOT NULL, ts REAL NOT NULL)"
+            )
+        self.purge_expired()
+
+    @staticmethod
+    def make_key(resolver: str, input_symbols: list[str], *args, **kwargs) -> str:
+        payload = json.dumps(
+            [CACHE_VERSION, resolver, dt.date.today().isoformat(), sorted(input_symbols), args, kwargs],
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[dict]:
+        with self._lock:
+            row = self._conn.execute("SELECT value, ts FROM symbol_cache WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        value, ts = row
+        if time.time() - ts > self.ttl_seconds:
+            return None
+        return json.loads(value)
+
+    def purge_expired(self) -> int:
+        """Delete rows older than the TTL, keys carry the date so past days are never read again."""
+        with self._lock, self._conn:
+            cursor = self._conn.execute("DELETE FROM symbol_cache WHERE ts < ?", (time.time() - self.ttl_seconds,))
+        return cursor.rowcount
+
+    def set(self, key: str, value: dict) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO symbol_cache (key, value, ts) VALUES (?, ?, ?)",
+                (key, json.dumps(value), time.time()),
+            )
+
+
+@lru_cache(maxsize=1)
+def get_symbol_cache() -> Optional[SymbolCache]:
+    """Return the process-wide cache, or None when SYMBOL_CACHE_PATH is not configured or cannot be opened."""
+    if not settings.symbol_cache_path:
+        return None
+    try:
+        return SymbolCache(settings.symbol_cache_path, ttl_seconds=settings.symbol_cache_ttl_hours * 3600)
+    except (OSError, sqlite3.Error) as e:
+        logger.warning(f"Symbol cache disabled, cannot open {settings.symbol_cache_path}: {e}")
+        return None
+
+
+def is_complete(mapping: dict, input_symbols: list[str]) -> bool:
+    """True when every input symbol resolved to a non-empty target."""
+    return all(mapping.get(sym) for sym in input_symbols)
+
+
+def cached_resolution(func):
+    """
+    Decorator for resolver `resolve` entrypoints: serve identical same-day requests from the on-disk cache.
+    Only results where every input resolved are stored, so partial failures are retried on the next call.
+    Cache read/write errors are logged and the resolver result is returned as is.
+    """
+
+    @wraps(func)
+    def wrapper(self, input_symbols: list[str], *args, **kwargs) -> dict:
+        cache = get_symbol_cache()
+        if cache is None:
+            return func(self, input_symbols, *args, **kwargs)
+
+        key = cache.make_key(type(self).__name__, input_symbols, *args, **kwargs)
+        try:
+            mapping = cache.get(key)
+        except sqlite3.Error as e:
+            logger.warning(f"Symbol cache read failed: {e}")
+            mapping = None
+        if mapping is not None:
+            logger.info(f"{type(self).__name__}: {len(mapping)} mappings served from symbol cache")
+            return mapping
+
+        mapping = func(self, input_symbols, *args, **kwargs)
+        if is_complete(mapping, input_symbols):
+            try:
+                cache.set(key, mapping)
+            except sqlite3.Error as e:
+                logger.warning(f"Symbol cache write failed: {e}")
+        return mapping
+
+    return wrapper
@@ -1,28 +1,51 @@
+import re
 import logging
-import databento as db
+import datetime as dt
+from typing import Optional
+from functools import lru_cache
 
 from tradetools.bdate import BDate
 
 from dataflow.config.settings import settings
 from dataflow.symbology.base import BaseSymbolResolver
+from dataflow.symbology.cache import cached_resolution
 
 logger = logging.getLogger(__name__)
 
+SERIES_ID_RE = re.compile(r"([^.]+)\.([^.]+)\.(\d+)")
+
+
+@lru_cache(maxsize=1)
+def resolution_date_range(today: str) -> tuple[str, str]:
+    """(start_date, end_date) for symbology requests, keyed by calendar date so it refreshes at midnight."""
+    bdate = BDate("T")
+    return bdate.delta_calendar_day(-1).date_str, bdate.date_str
+
 
 class DatabentoSymbolResolve(BaseSymbolResolver):
+    __slots__ = (
+        "client", "mapping", "symbol_type_in", "symbol_type_out", "continuous_type",
+        "_raw_symbol_cache", "_cache_date",
+    )
 
     def __init__(self,
                  symbol_type_in: str = "continuous",
                  symbol_type_out: str = "raw_symbol",
                  continuous_type: str = "c"  # n: open interest, v: volume
                  ):
+        # databento is heavy to import, defer it until a resolver is actually needed
+        import databento as db
 
         self.client = db.Historical(settings.databento_api_key)
         self.mapping = {}
         self.symbol_type_in = symbol_type_in
         self.symbol_type_out = symbol_type_out
         self.continuous_type = continuous_type
+        # instrument_id -> raw_symbol, only valid for the trading day in _cache_date
+        self._raw_symbol_cache: dict[str, str] = {}
+        self._cache_date: Optional[str] = None
 
+    @cached_resolution
     def resolve(self, input_symbols: list[str], data_set: str) -> dict[str, str]:
         if data_set == "GLBX.MDP3":
             return self.resolve_cme(input_symbols)
@@ -31,14 +54,20 @@ class DatabentoSymbolResolve(BaseSymbolResolver):
             return {}
 
     def resolve_cme(self, input_symbols: list) -> dict[str, str]:
-        start_date = BDate("T").delta_calendar_day(-1).date_str
-        end_date = BDate("T").date_str
+        start_date, end_date = resolution_date_range(dt.date.today().isoformat())
+
+        if self._cache_date != end_date:
+            self._raw_symbol_cache.clear()
+            self._cache_date = end_date
 
         # Step 1: Build series_id → db_id mapping
-        series_id_to_db_id = {
-            symbol: f"{symbol.split('.')[1]}.{self.continuous_type}.{int(symbol.split('.')[2]) - 1}"
-            for symbol in input_symbols
-        }
+        series_id_to_db_id = {}
+        for symbol in input_symbols:
+            match = SERIES_ID_RE.fullmatch(symbol)
+            if match is None:
+                raise ValueError(f"Invalid series id: {symbol}, expected <venue>.<root>.<term>")
+            _, root, term = match.groups()
+            series_id_to_db_id[symbol] = f"{root}.{self.continuous_type}.{int(term) - 1}"
 
         # Step 2: Resolve databento_id → instrument_id
         instrument_id_res = self.client.symbology.resolve(
@@ -56,21 +85,26 @@ class DatabentoSymbolResolve(BaseSymbolResolver):
         for db_id, instrument_id in instrument_id_res["result"].items():
             db_id_to_db_instrument_id[db_id] = instrument_id[0]["s"]
 
-        # Step 3: Resolve instrument_id → raw_symbol
-        raw_symbols_res = self.client.symbology.resolve(
-            dataset="GLBX.MDP3",
-            symbols=list(db_id_to_db_instrument_id.values()),
-            stype_in="instrument_id",
-            stype_out="raw_symbol",
-            start_date=start_date,
-            end_date=end_date,
-        )
-        if raw_symbols_res["message"] != "OK":
-            raise ValueError(f"Failed to resolve raw symbol: {raw_symbols_res['message']}")
-
-        instrument_id_to_raw_symbol ={}
-        for instrument_id, raw_symbol in raw_symbols_res["result"].items():
-            instrument_id_to_raw_symbol[instrument_id] = raw_symbol[0]["s"]
+        # Step 3: Resolve instrument_id → raw_symbol, skipping ids already resolved today
+        missing_instrument_ids = [
+            inst_id for inst_id in set(db_id_to_db_instrument_id.values())
+            if inst_id not in self._raw_symbol_cache
+        ]
+        if missing_instrument_ids:
+            raw_symbols_res = self.client.symbology.resolve(
+                dataset="GLBX.MDP3",
+                symbols=missing_instrument_ids,
+                stype_in="instrument_id",
+                stype_out="raw_symbol",
+                start_date=start_date,
+                end_date=end_date,
+            )
+            if raw_symbols_res["message"] != "OK":
+                raise ValueError(f"Failed to resolve raw symbol: {raw_symbols_res['message']}")
+
+            for instrument_id, raw_symbol in raw_symbols_res["result"].items():
+                self._raw_symbol_cache[instrument_id] = raw_symbol[0]["s"]
+        instrument_id_to_raw_symbol = self._raw_symbol_cache
 
         # Step 4: Chain mappings: series_id → raw_symbol
         final_mapping = {}
@@ -90,13 +124,7 @@ class DatabentoSymbolResolve(BaseSymbolResolver):
             logger.warning(f"No mapping found for {len(input_symbols)} series")
         return final_mapping
 
-db_symbol_resolver = DatabentoSymbolResolve()
-
-
-
-
-
-
-
-
 
+@lru_cache(maxsize=1)
+def get_db_symbol_resolver() -> DatabentoSymbolResolve:
+    return DatabentoSymbolResolve()
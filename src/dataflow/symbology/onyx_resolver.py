@@ -1,15 +1,19 @@
-import requests
 import logging
+from functools import lru_cache
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 
 from dataflow.config.settings import settings
 from dataflow.utils.common import parse_web_response
 from dataflow.symbology.base import BaseSymbolResolver
+from dataflow.symbology.cache import cached_resolution
 
 logger = logging.getLogger(__name__)
 
 
 class OnyxSymbolResolve(BaseSymbolResolver):
+    __slots__ = ("symbol_type_in", "symbol_type_out", "headers", "session")
+
     def __init__(self,
                  symbol_type_in: str = "product_id",
                  symbol_type_out: str = "raw_symbol",
@@ -19,35 +23,69 @@ class OnyxSymbolResolve(BaseSymbolResolver):
         self.headers = {
             "Authorization": f"Bearer {settings.onyx_api_key}",
         }
+        self.session = self.create_session()
+
+    def create_session(self):
+        """
+        Keep-alive session with a pooled, retrying adapter shared by all product lookups.
+        Once retries are exhausted the last response is returned, not raised, so parse_web_response
+        reports the failure for that product only.
+        """
+        # requests is heavy to import, defer it until a resolver is actually needed
+        import requests
+        from urllib3.util.retry import Retry
+        from requests.adapters import HTTPAdapter
 
+        session = requests.Session()
+        session.headers.update(self.headers)
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=16,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=(429, 500, 502, 503, 504),
+                raise_on_status=False,
+            ),
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def fetch_product(self, product_name: str) -> tuple:
+        resp = self.session.get(f"{settings.onyx_url}/tickers/live/{product_name}")
+        return parse_web_response(resp)
+
+    @cached_resolution
     def resolve(self, input_symbols: list[str]) -> dict[str, str]:
         """
             input_symbols: "ONYX.NAPEW.1", "ONYX.NAPEW.2", "ONYX.NAPEW.3"
         """
         final_mapping = {}
-        groups = defaultdict(list)
+        groups = defaultdict(list)  # {product: [(term, series_id)]}
         for sym in input_symbols:
             parts = sym.split('.')
             if len(parts) == 3:
-                product = parts[1]
-                groups[product].append(sym)
+                _, product, term = parts
+                groups[product].append((int(term), sym))
             else:
                 raise ValueError(f"Onyx series id must consist of 3 parts: {sym}")
 
-        for product in groups:
-            groups[product].sort(key=lambda x: int(x.split('.')[2]))
+        for terms in groups.values():
+            terms.sort()
+
+        if groups:
+            with ThreadPoolExecutor(max_workers=min(8, len(groups))) as executor:
+                responses = dict(zip(groups, executor.map(self.fetch_product, groups)))
+        else:
+            responses = {}
 
-        for product_name, input_symbols in groups.items():
-            params = {
-                "product_symbol": product_name,
-            }
-            url = f"{settings.onyx_url}/tickers/live/{product_name}"
-            resp = requests.get(url, headers=self.headers)
-            data, error = parse_web_response(resp)
+        for product_name, series_ids in groups.items():
+            data, error = responses[product_name]
             if error:
                 logger.error(f"Failed to all futures data for {product_name}: {error}")
             else:
-                for i, series_id in enumerate(input_symbols):
+                for i, (_, series_id) in enumerate(series_ids):
                     raw_symbol = data[i]["symbol"]
                     final_mapping[series_id] = raw_symbol
         if final_mapping:
@@ -58,9 +96,11 @@ class OnyxSymbolResolve(BaseSymbolResolver):
         return final_mapping
 
 
-onyx_symbol_resolver = OnyxSymbolResolve()
+@lru_cache(maxsize=1)
+def get_onyx_symbol_resolver() -> OnyxSymbolResolve:
+    return OnyxSymbolResolve()
 
 
 if __name__ == "__main__":
-    mapping = onyx_symbol_resolver.resolve(["ONYX.NAPEW.1", "ONYX.NAPEW.2", "ONYX.NAPEW.3"])
+    mapping = get_onyx_symbol_resolver().resolve(["ONYX.NAPEW.1", "ONYX.NAPEW.2", "ONYX.NAPEW.3"])
     print(mapping)
\ No newline at end of file
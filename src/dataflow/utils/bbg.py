@@ -1,4 +1,10 @@
-DATAFLOW_ID_TO_BBG = {
+import logging
+from types import MappingProxyType
+
+logger = logging.getLogger(__name__)
+
+
+DATAFLOW_ID_TO_BBG = MappingProxyType({
     'ICE.B':  'CO',  # Crude Oil, Brent
     'ICE.G':  'QS',  # Gas oil, ICE, Low Su, europe
     'CME.CL': 'CL',  # Crude Oil, WTI
@@ -14,10 +20,10 @@ DATAFLOW_ID_TO_BBG = {
     'LME.NI': 'LN',  # Nickel
     'LME.PB': 'LL',  # Lead
     'LME.ZS': 'LX',  # Zinc
-}
+})
 
 
-BBG_SYMBOL_SPEC = {
+BBG_SYMBOL_SPEC = MappingProxyType({
     'CL': {'asset_type': 'fut', 'bbg_root_id': 'CL', 'year_digit': 1, 'suffix': ' Comdty'},
     'CO': {'asset_type': 'fut', 'bbg_root_id': 'CO', 'year_digit': 1, 'suffix': ' Comdty'},
     'GC': {'asset_type': 'fut', 'bbg_root_id': 'GC', 'year_digit': 1, 'suffix': ' Comdty'},
@@ -41,9 +47,42 @@ BBG_SYMBOL_SPEC = {
     'XAGUSD': {'asset_type': 'fx', 'bbg_root_id': 'XAGUSD', 'year_digit': 0, 'suffix': ' Currency'},
     'XAUUSD': {'asset_type': 'fx', 'bbg_root_id': 'XAUUSD', 'year_digit': 0, 'suffix': ' Currency'},
     'XPTUSD': {'asset_type': 'fx', 'bbg_root_id': 'XPTUSD', 'year_digit': 0, 'suffix': ' Currency'}
-}
+})
+
+
+# dataflow root id -> (bbg root, suffix, year digit), flattened once so resolvers do a single lookup
+DATAFLOW_ID_SPEC = MappingProxyType({
+    dataflow_id: (bbg_id, BBG_SYMBOL_SPEC[bbg_id]["suffix"], BBG_SYMBOL_SPEC[bbg_id]["year_digit"])
+    for dataflow_id, bbg_id in DATAFLOW_ID_TO_BBG.items()
+})
 
 
 COLUMN_MAPPING = {
     "LME": {"date": "TIMESTAMP"}
-}
\ No newline at end of file
+}
+
+
+def group_option_chain(opt_chain, bbg_ids: list[str]) -> dict[str, list[str]]:
+    """
+    Split a bulk OPT_CHAIN reference data response into option tickers per requested future.
+    Rows are keyed back to their future by the response's SYMBOL column.
+    """
+    if "SYMBOL" not in opt_chain.columns:
+        raise ValueError(f"OPT_CHAIN response has no SYMBOL column: {list(opt_chain.columns)}")
+
+    tickers = opt_chain["SECURITY_DESCRIPTION"].str.replace(r"\s+", " ", regex=True).str.strip()
+    chains = {bbg_id: [] for bbg_id in bbg_ids}
+    unexpected = set()
+    for bbg_id, ticker in zip(opt_chain["SYMBOL"], tickers):
+        options = chains.get(bbg_id)
+        if options is None:
+            unexpected.add(bbg_id)
+        else:
+            options.append(ticker)
+
+    if unexpected:
+        logger.error(f"OPT_CHAIN returned rows for unrequested symbols: {sorted(unexpected)}")
+    empty = [bbg_id for bbg_id, options in chains.items() if not options]
+    if empty:
+        logger.error(f"OPT_CHAIN returned no options for {empty}")
+    return chains
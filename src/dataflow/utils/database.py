@@ -1,5 +1,21 @@
 from typing import Any, Optional
-from urllib.parse import quote_plus
+from functools import lru_cache
+from urllib.parse import quote_from_bytes
+
+# Already URL-encoded, used when no MSSQL driver is configured
+DEFAULT_MSSQL_DRIVER = "ODBC+Driver+17+for+SQL+Server"
+
+
+@lru_cache(maxsize=256)
+def encode_url_component(value: str) -> str:
+    """
+    URL-encode a connection string component (username, password, driver).
+    Memoized since the same credentials are re-encoded every time a connection string is rebuilt.
+    Equivalent to quote_plus(value), with a shortcut for plain alphanumeric values which need no encoding.
+    """
+    if value.isascii() and value.isalnum():
+        return value
+    return quote_from_bytes(value.encode("utf-8"), safe="").replace("%20", "+")
 
 
 class DatabaseConnectionBuilder:
@@ -40,24 +56,19 @@ class DatabaseConnectionBuilder:
         Raises:
             ValueError: If db_type is not supported.
         """
-        db_type = db_type.lower()
-
-        if db_type == "mssql":
-            return DatabaseConnectionBuilder._build_sqlalchemy_mssql(
-                host, port, database, username, password, driver, trusted_connection, autocommit
-            )
-        elif db_type == "postgresql":
-            return DatabaseConnectionBuilder._build_sqlalchemy_postgresql(
-                host, port, database, username, password, trusted_connection
-            )
-        elif db_type == "mysql":
-            return DatabaseConnectionBuilder._build_sqlalchemy_mysql(
-                host, port, database, username, password, autocommit
-            )
-        elif db_type == "sqlite":
-            return DatabaseConnectionBuilder._build_sqlalchemy_sqlite(database)
-        else:
-            raise ValueError(f"Unsupported database type: {db_type}")
+        builder = DatabaseConnectionBuilder.SQLALCHEMY_BUILDERS.get(db_type.lower())
+        if builder is None:
+            raise ValueError(f"Unsupported database type: {db_type.lower()}")
+        return builder(
+            host=host,
+            port=port,
+            database=database,
+            username=username,
+            password=password,
+            driver=driver,
+            trusted_connection=trusted_connection,
+            autocommit=autocommit,
+        )
 
     @staticmethod
     def build_peewee_connection_params(
@@ -91,20 +102,19 @@ class DatabaseConnectionBuilder:
         Raises:
             ValueError: If db_type is not supported.
         """
-        db_type = db_type.lower()
-
-        if db_type == "postgresql":
-            return DatabaseConnectionBuilder._build_peewee_postgresql(
-                host, port, database, username, password
-            )
-        elif db_type == "mysql":
-            return DatabaseConnectionBuilder._build_peewee_mysql(
-                host, port,  database, username, password, autocommit
-            )
-        elif db_type == "sqlite":
-            return DatabaseConnectionBuilder._build_peewee_sqlite(database)
-        else:
-            raise ValueError(f"Unsupported database type for Peewee: {db_type}")
+        builder = DatabaseConnectionBuilder.PEEWEE_BUILDERS.get(db_type.lower())
+        if builder is None:
+            raise ValueError(f"Unsupported database type for Peewee: {db_type.lower()}")
+        return builder(
+            host=host,
+            port=port,
+            database=database,
+            username=username,
+            password=password,
+            driver=driver,
+            trusted_connection=trusted_connection,
+            autocommit=autocommit,
+        )
 
     # === SQLAlchemy Builders ===
 
@@ -118,32 +128,28 @@ class DatabaseConnectionBuilder:
             driver: str,
             trusted_connection: bool,
             autocommit: bool,
+            **_,
     ) -> str:
         """
         Build SQLAlchemy connection string for MSSQL.
         """
         if not port:
             port = 3306
-        driver_encoded = quote_plus(driver) if driver else "ODBC+Driver+17+for+SQL+Server"
+        driver_encoded = encode_url_component(driver) if driver else DEFAULT_MSSQL_DRIVER
+        autocommit_param = "&autocommit=true" if autocommit else ""
 
         if trusted_connection:
-            conn_str = (
+            return (
                 f"mssql+pyodbc:///{host}:{port}/{database}"
                 f"?driver={driver_encoded}"
-                f"&trusted_connection=yes"
-            )
-        else:
-            username_encoded = quote_plus(username)
-            password_encoded = quote_plus(password)
-            conn_str = (
-                f"mssql+pyodbc:///{username_encoded}:{password_encoded}@{host}:{port}/{database}"
-                f"?driver={driver_encoded}"
+                f"&trusted_connection=yes{autocommit_param}"
             )
-
-        if autocommit:
-            conn_str += "&autocommit=true"
-
-        return conn_str
+        username_encoded = encode_url_component(username)
+        password_encoded = encode_url_component(password)
+        return (
+            f"mssql+pyodbc:///{username_encoded}:{password_encoded}@{host}:{port}/{database}"
+            f"?driver={driver_encoded}{autocommit_param}"
+        )
 
     @staticmethod
     def _build_sqlalchemy_postgresql(
@@ -153,28 +159,23 @@ class DatabaseConnectionBuilder:
             username: str,
             password: str,
             trusted_connection: bool = False,
-            autocommit: bool = False,
+            **_,
     ) -> str:
         """
         Build SQLAlchemy connection string for PostgreSQL.
+        autocommit is not a psycopg2 connection option, it is absorbed and never put on the URL.
         """
         if not port:
             port = 5432
         if trusted_connection:
             # PostgreSQL trust authentication (no password required)
-            username_encoded = quote_plus(username) if username else "postgres"
-            conn_str = f"postgresql+psycopg2:///{username_encoded}@{host}:{port}/{database}"
-        else:
-            # Standard username/password authentication
-            username_encoded = quote_plus(username)
-            password_encoded = quote_plus(password)
-            conn_str = f"postgresql+psycopg2://{username_encoded}:{password_encoded}@{host}:{port}/{database}"
+            username_encoded = encode_url_component(username) if username else "postgres"
+            return f"postgresql+psycopg2:///{username_encoded}@{host}:{port}/{database}"
 
-        # PostgreSQL supports autocommit as a connection parameter
-        if autocommit:
-            conn_str += "?autocommit=true"
-
-        return conn_str
+        # Standard username/password authentication
+        username_encoded = encode_url_component(username)
+        password_encoded = encode_url_component(password)
+        return f"postgresql+psycopg2://{username_encoded}:{password_encoded}@{host}:{port}/{database}"
 
     @staticmethod
     def _build_sqlalchemy_mysql(
@@ -183,34 +184,22 @@ class DatabaseConnectionBuilder:
             database: str,
             username: str,
             password: str,
-            trusted_connection: bool = False,
             autocommit: bool = False,
+            **_,
     ) -> str:
         """
-        Build SQLAlchemy connection string for MySQL.
+        Build SQLAlchemy connection string for MySQL, always with username/password authentication.
         """
         if not port:
             port = 3306
-        if trusted_connection:
-            # MySQL socket authentication (Unix/Linux only)
-            # Uses current OS user, no password needed
-            username_encoded = quote_plus(username) if username else "root"
-            conn_str = f"mysql+pymysql:///{username_encoded}@{host}:{port}/{database}"
-        else:
-            # Standard username/password authentication
-            username_encoded = quote_plus(username)
-            password_encoded = quote_plus(password)
-            conn_str = f"mysql+pymysql://{username_encoded}:{password_encoded}@{host}:{port}/{database}"
-
-        # Add autocommit parameter
-        separator = "&" if "?" in conn_str else "?"
-        if autocommit:
-            conn_str += f"{separator}autocommit=true"
-
-        return conn_str
+        # Add autocommit parameter, the base URL never carries a query string
+        autocommit_param = "?autocommit=true" if autocommit else ""
+        username_encoded = encode_url_component(username)
+        password_encoded = encode_url_component(password)
+        return f"mysql+pymysql://{username_encoded}:{password_encoded}@{host}:{port}/{database}{autocommit_param}"
 
     @staticmethod
-    def _build_sqlalchemy_sqlite(database: str) -> str:
+    def _build_sqlalchemy_sqlite(database: str, **_) -> str:
         """
         Build SQLAlchemy connection string for SQLite.
         """
@@ -223,6 +212,7 @@ class DatabaseConnectionBuilder:
             database: str,
             username: str,
             password: str,
+            **_,
     ) -> dict:
         """
         Build Peewee connection parameters for PostgreSQL.
@@ -243,6 +233,7 @@ class DatabaseConnectionBuilder:
             username: str,
             password: str,
             autocommit: bool = False,
+            **_,
     ) -> dict:
         """
         Build Peewee connection parameters for MySQL.
@@ -261,10 +252,24 @@ class DatabaseConnectionBuilder:
         return params
 
     @staticmethod
-    def _build_peewee_sqlite(database: str) -> dict:
+    def _build_peewee_sqlite(database: str, **_) -> dict:
         """
         Build Peewee connection parameters for SQLite.
         """
         return {
             'database': database,
-        }
\ No newline at end of file
+        }
+
+    # db_type -> builder. Builders share one keyword signature, options they do not use are absorbed by **_
+    SQLALCHEMY_BUILDERS = {
+        "mssql": _build_sqlalchemy_mssql,
+        "postgresql": _build_sqlalchemy_postgresql,
+        "mysql": _build_sqlalchemy_mysql,
+        "sqlite": _build_sqlalchemy_sqlite,
+    }
+
+    PEEWEE_BUILDERS = {
+        "postgresql": _build_peewee_postgresql,
+        "mysql": _build_peewee_mysql,
+        "sqlite": _build_peewee_sqlite,
+    }
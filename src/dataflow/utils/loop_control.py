@@ -3,6 +3,7 @@ import logging
 import zoneinfo
 import threading
 import datetime as dt
+from collections import deque
 from typing import Optional, Union
 from abc import ABC, abstractmethod
 
@@ -13,6 +14,16 @@ class BaseGate(ABC):
     """
     Unifies the interface used by the orchestrator.
     """
+    poll_seconds: float = 1.0
+
+    def __init__(self):
+        self._stop = threading.Event()
+
+    def stop(self) -> None:
+        """
+        Request the loop to stop. Wakes up a gate sleeping in wait_until_start() or sleep_tick() immediately.
+        """
+        self._stop.set()
 
     def wait_until_start(self) -> None:
         """
@@ -41,6 +52,12 @@ class BaseGate(ABC):
         """
         raise NotImplementedError
 
+    def tick_seconds(self) -> float:
+        """
+        How long the next sleep_tick() should wait. Default: poll_seconds.
+        """
+        return self.poll_seconds
+
     def on_job_finished(self, count: int = 1) -> None:
         """
         Optional: notify gate(s) that some job(s) finished. Default: no-op.
@@ -49,7 +66,13 @@ class BaseGate(ABC):
 
     @staticmethod
     def _parse_datetime(value: dt.datetime | str) -> dt.datetime:
-        if isinstance(value, dt.datetime):
+        value_type = type(value)
+        if value_type is dt.datetime:
+            return value
+        elif value_type is str:
+            return dt.datetime.fromisoformat(value)
+        # subclasses (e.g. pandas.Timestamp) take the slower path
+        elif isinstance(value, dt.datetime):
             return value
         elif isinstance(value, str):
             return dt.datetime.fromisoformat(value)
@@ -71,10 +94,13 @@ class RuntimeControl(BaseGate):
                  new_thread: bool = False,
                  max_job: Optional[int] = None,
                  ):
+        super().__init__()
         self.start = self._parse_datetime(start)
         self.end = self._parse_datetime(end)
         self.poll_seconds = poll_seconds
         self._tz = self.get_timezone()
+        # end translated onto the monotonic clock once, so polling compares floats instead of building datetimes
+        self._end_monotonic = time.monotonic() + self._seconds_until(self.end)
         self.run_in_thread = run_in_thread
         self.new_thread = new_thread
         self.max_job = max_job
@@ -91,6 +117,8 @@ class RuntimeControl(BaseGate):
                 logger.warning(f"Skipped execution of {func.__name__}: current time {self._now()} >= end {self.end}")
                 return
             self.wait_until_start()
+            should_continue = self.should_continue
+            on_idle = self.on_idle
 
             if self.run_in_thread:
                 if self.new_thread:
@@ -107,37 +135,40 @@ class RuntimeControl(BaseGate):
                 else:
                     _ = func(*args, **kwargs)  # assume func will start a separate daemon thread
 
-                while self.should_continue():
-                    if self.on_idle:
-                        self.on_idle()
+                while should_continue():
+                    on_idle()
                 self.stop_event.set()
             else:
-                while self.should_continue():
+                while should_continue():
                     job_done = func(*args, **kwargs)
                     if job_done:
                         self.add_job_done(job_done)
-                    if self.on_idle:
-                        self.on_idle()
+                    on_idle()
         return wrapper
 
     def get_timezone(self) -> Optional[zoneinfo.ZoneInfo]:
         start_tz_info = self.start.tzinfo
         end_tz_info = self.end.tzinfo
-        if start_tz_info == end_tz_info:
+        # ZoneInfo instances are cached per key, so the identity check covers the common case
+        if start_tz_info is end_tz_info or start_tz_info == end_tz_info:
             return start_tz_info
         else:
             raise ValueError("start and end timezones are not compatible")
 
     def wait_until_start(self) -> None:
-        now = self._now()
-        if now >= self.start:
+        sleep_duration = self._seconds_until(self.start)
+        if sleep_duration <= 0:
             return
-        sleep_duration = (self.start - now).total_seconds()
+        now = self._now()
         logger.info(f"Waiting to start at {self.start}; current time: {now}; sleeping for {sleep_duration:.2f} seconds")
-        time.sleep(sleep_duration)
+        self._stop.wait(sleep_duration)
 
     def should_continue(self) -> bool:
-        if self._now() > self.end:
+        if self._stop.is_set():
+            logger.info("Service stop requested, stopping.")
+            return False
+
+        if time.monotonic() > self._end_monotonic:
             logger.info(f"Service passed end time {self.end} stopping.")
             return False
 
@@ -150,13 +181,14 @@ class RuntimeControl(BaseGate):
     def on_idle(self) -> None:
         return self.sleep_tick()
 
+    def tick_seconds(self) -> float:
+        return min(self.poll_seconds, self.remaining_seconds())
+
     def sleep_tick(self) -> None:
-        now = self._now()
-        remaining = (self.end - now).total_seconds()
-        time.sleep(min(self.poll_seconds, max(0.0, remaining)))
+        self._stop.wait(self.tick_seconds())
 
     def remaining_seconds(self) -> float:
-        return max(0.0, (self.end - self._now()).total_seconds())
+        return max(0.0, self._end_monotonic - time.monotonic())
 
     def set_max_job(self, max_job: int) -> None:
         self.max_job = max_job
@@ -167,6 +199,14 @@ class RuntimeControl(BaseGate):
     def _now(self) -> dt.datetime:
         return dt.datetime.now(self._tz) if self._tz else dt.datetime.now()
 
+    @staticmethod
+    def _seconds_until(moment: dt.datetime) -> float:
+        """
+        Elapsed seconds from now until moment. Subtracting datetimes that share a tzinfo gives the wall-clock
+        difference, which is off by an hour across a DST change, so both sides are taken as POSIX timestamps.
+        """
+        return moment.timestamp() - time.time()
+
 
 class JobCountControl(BaseGate):
     """
@@ -175,14 +215,21 @@ class JobCountControl(BaseGate):
     """
 
     def __init__(self, max_jobs: Optional[int] = None, poll_seconds: float = 1.0,):
+        super().__init__()
         self._max = max_jobs if (max_jobs is not None and max_jobs > 0) else None
         self._done = 0
         self.poll_seconds: float = poll_seconds
-        self._lock = threading.Lock()
+        # Workers report completions with an atomic deque.append; the loop thread is the only
+        # consumer and folds them into _done, so no lock is taken on the reporting path.
+        self._finished = deque()
 
     def should_continue(self) -> bool:
+        if self._stop.is_set():
+            return False
         if self._max is None:
             return True
+        while self._finished:
+            self._done += self._finished.popleft()
         return self._done < self._max
 
     def on_job_finished(self, count: int = 1) -> None:
@@ -190,14 +237,16 @@ class JobCountControl(BaseGate):
             return
         if count <= 0:
             return
-        with self._lock:
-            self._done += count
+        self._finished.append(count)
 
     def sleep_tick(self) -> None:
-        time.sleep(self.poll_seconds)
+        self._stop.wait(self.tick_seconds())
 
     def add_job_done(self, count: int = 1) -> None:
-        self._done += count
+        # without a budget should_continue never drains the deque, so nothing may be queued
+        if self._max is None:
+            return
+        self._finished.append(count)
 
 
 class AllGate(BaseGate):
@@ -209,6 +258,7 @@ class AllGate(BaseGate):
     def __init__(self, *gates: BaseGate):
         if not gates:
             raise ValueError("AllGate requires at least one gate")
+        super().__init__()
         self._gates = gates
 
     def wait_until_start(self) -> None:
@@ -216,16 +266,27 @@ class AllGate(BaseGate):
             g.wait_until_start()
 
     def should_continue(self) -> bool:
-        return all(g.should_continue() for g in self._gates)
-
-    def sleep_tick(self, poll_seconds: float = 1.0) -> None:
         for g in self._gates:
-            g.sleep_tick()
+            if not g.should_continue():
+                return False
+        return True
+
+    def tick_seconds(self) -> float:
+        return min(g.tick_seconds() for g in self._gates)
+
+    def sleep_tick(self) -> None:
+        # One wait for the shortest child interval, rather than each child sleeping in turn
+        self._stop.wait(self.tick_seconds())
 
     def on_job_finished(self, count: int = 1) -> None:
         for g in self._gates:
             g.on_job_finished(count=count)
 
+    def stop(self) -> None:
+        super().stop()
+        for g in self._gates:
+            g.stop()
+
 
 class AnyGate(BaseGate):
     """
@@ -236,6 +297,7 @@ class AnyGate(BaseGate):
     def __init__(self, *gates: BaseGate):
         if not gates:
             raise ValueError("AnyGate requires at least one gate")
+        super().__init__()
         self._gates = gates
 
     def wait_until_start(self) -> None:
@@ -243,16 +305,27 @@ class AnyGate(BaseGate):
             g.wait_until_start()
 
     def should_continue(self) -> bool:
-        return any(g.should_continue() for g in self._gates)
-
-    def sleep_tick(self, poll_seconds: float = 1.0) -> None:
         for g in self._gates:
-            g.sleep_tick()
+            if g.should_continue():
+                return True
+        return False
+
+    def tick_seconds(self) -> float:
+        return min(g.tick_seconds() for g in self._gates)
+
+    def sleep_tick(self) -> None:
+        # One wait for the shortest child interval, rather than each child sleeping in turn
+        self._stop.wait(self.tick_seconds())
 
     def on_job_finished(self, count: int = 1) -> None:
         for g in self._gates:
             g.on_job_finished(count=count)
 
+    def stop(self) -> None:
+        super().stop()
+        for g in self._gates:
+            g.stop()
+
 
 def make_time_and_job_gate(
     start: Union[dt.datetime, dt.time],
@@ -0,0 +1,30 @@
+import time
+import threading
+from typing import Optional
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket: allows bursts of up to `burst` calls, refilled at `rate` calls per second.
+    acquire() only sleeps when the bucket is empty.
+    """
+
+    def __init__(self, rate: float, burst: Optional[int] = None):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = float(burst if burst is not None else max(1, int(rate)))
+        self._tokens = self.capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            wait = (1.0 - self._tokens) / self.rate if self._tokens < 1.0 else 0.0
+            # Reserve the token now so concurrent callers queue behind this one
+            self._tokens -= 1.0
+        if wait > 0:
+            time.sleep(wait)
@@ -1,9 +1,11 @@
+from types import MappingProxyType
+
 from datacore.models.mktdata.realtime import MarketByPrice1
 from datacore.models.mktdata.historical import OHLCV1D, Option1D
 from datacore.models.mktdata.schema import MktDataSchema
 
-SCHEMA_MAP = {
+SCHEMA_MAP = MappingProxyType({
     MktDataSchema.MBP_1: MarketByPrice1,
     MktDataSchema.OHLCV_1D: OHLCV1D,
     MktDataSchema.OPTION_1D: Option1D
-}
\ No newline at end of file
+})
@@ -1,12 +1,56 @@
+import gzip
 import json
+import base64
 import logging
+from enum import Enum
 from pathlib import Path
 from typing import List
+from string import Template
 from dataflow.config.loaders.time_series import TimeSeriesConfig
 
 
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+
+    def to_json(obj) -> str:
+        return orjson.dumps(obj).decode("utf-8")
+
+    def to_json_bytes(obj) -> bytes:
+        return orjson.dumps(obj)
+except ImportError:  # orjson is optional, the stdlib encoder produces the same compact output
+    def to_json(obj) -> str:
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+    def to_json_bytes(obj) -> bytes:
+        return to_json(obj).encode("utf-8")
+
+
+def encode_payload(payload_json: bytes) -> bytes:
+    """
+    Gzip + base64 the dashboard payload, the page inflates it with DecompressionStream.
+    mtime is pinned so identical inputs produce a byte-identical page.
+    """
+    return base64.b64encode(gzip.compress(payload_json, mtime=0))
+
+
+# Column order of the rows embedded in the dashboard, the page rebuilds row objects from it
+ROW_KEYS = (
+    'service_id', 'series_id', 'series_type', 'root_id', 'venue', 'data_schema', 'data_source',
+    'destination', 'extractor', 'description', 'additional_params', 'symbol', 'active',
+)
+
+TEMPLATE_DIR = Path(__file__).resolve().parent / "templates"
+
+# Read once at import. In dashboard.html, JS template literals are escaped as $${...}
+# The page is split around the data payload so the payload can be written straight to the file,
+# the static tail is kept pre-encoded.
+DASHBOARD_CSS = (TEMPLATE_DIR / "dashboard.css").read_text(encoding="utf-8").rstrip()
+_head, _, _tail = (TEMPLATE_DIR / "dashboard.html").read_text(encoding="utf-8").partition("$ts_json")
+DASHBOARD_HEAD = Template(_head)
+DASHBOARD_TAIL = Template(_tail).substitute().encode("utf-8")
+
 
 def time_series_html(time_series: List[TimeSeriesConfig], output_path: Path = None) -> None:
     """
@@ -19,1318 +63,48 @@ def time_series_html(time_series: List[TimeSeriesConfig], output_path: Path = No
     if output_path is None:
         output_path = Path("./time_series.html")
     
-    # Prepare data for JavaScript
-    ts_data = []
-    for ts in time_series:
-        ts_dict = {
-            'service_id': ts.service_id,
-            'series_id': ts.series_id,
-            'series_type': ts.series_type,
-            'root_id': ts.root_id,
-            'venue': ts.venue,
-            'data_schema': ts.data_schema.value if hasattr(ts.data_schema, 'value') else str(ts.data_schema),
-            'data_source': ts.data_source,
-            'destination': ', '.join(ts.destination) if ts.destination else '',
-            'extractor': ts.extractor,
-            'description': ts.description or '',
-            'additional_params': json.dumps(ts.additional_params) if ts.additional_params else '{}',
-            'symbol': ts.symbol or '',
-            'active': ts.active
-        }
-        ts_data.append(ts_dict)
-    
-    # Group by venue
-    venues = {}
+    # Prepare data for JavaScript and the header stats in a single pass
+    rows = []
+    venues = set()
+    sources = set()
+    active_count = 0
     for ts in time_series:
         venue = ts.venue
-        if venue not in venues:
-            venues[venue] = []
-        venues[venue].append(ts)
-    
-    # Group by data_source
-    sources = {}
-    for ts in time_series:
         source = ts.data_source
-        if source not in sources:
-            sources[source] = []
-        sources[source].append(ts)
-    
-    html_content = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Time Series Configuration Dashboard</title>
-    <link href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.0/css/all.min.css" rel="stylesheet">
-    <style>
-        :root {{
-            --primary-color: #667eea;
-            --secondary-color: #764ba2;
-            --accent-color: #f093fb;
-            --success-color: #4ecdc4;
-            --warning-color: #ffe066;
-            --error-color: #ff6b6b;
-            --text-primary: #2c3e50;
-            --text-secondary: #7f8c8d;
-            --bg-primary: #f8fafc;
-            --bg-secondary: #ffffff;
-            --bg-tertiary: #f1f5f9;
-            --border-color: #e2e8f0;
-            --shadow-light: 0 4px 6px -1px rgba(0, 0, 0, 0.1), 0 2px 4px -1px rgba(0, 0, 0, 0.06);
-            --shadow-medium: 0 10px 15px -3px rgba(0, 0, 0, 0.1), 0 4px 6px -2px rgba(0, 0, 0, 0.05);
-            --shadow-heavy: 0 25px 50px -12px rgba(0, 0, 0, 0.25);
-            --glass-bg: rgba(255, 255, 255, 0.25);
-            --glass-border: rgba(255, 255, 255, 0.18);
-        }}
-
-        [data-theme="dark"] {{
-            --text-primary: #f1f5f9;
-            --text-secondary: #94a3b8;
-            --bg-primary: #0f172a;
-            --bg-secondary: #1e293b;
-            --bg-tertiary: #334155;
-            --border-color: #475569;
-            --glass-bg: rgba(30, 41, 59, 0.8);
-            --glass-border: rgba(148, 163, 184, 0.3);
-            --shadow-light: 0 4px 6px -1px rgba(0, 0, 0, 0.3), 0 2px 4px -1px rgba(0, 0, 0, 0.2);
-            --shadow-medium: 0 10px 15px -3px rgba(0, 0, 0, 0.4), 0 4px 6px -2px rgba(0, 0, 0, 0.3);
-            --shadow-heavy: 0 25px 50px -12px rgba(0, 0, 0, 0.6);
-        }}
-
-        * {{
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }}
-        
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, Cantarell, sans-serif;
-            background: var(--bg-primary);
-            padding: 20px;
-            color: var(--text-primary);
-            transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1);
-            position: relative;
-            overflow-x: hidden;
-        }}
-
-        body::before {{
-            content: '';
-            position: fixed;
-            top: 0;
-            left: 0;
-            width: 100%;
-            height: 100%;
-            background: linear-gradient(135deg, var(--primary-color) 0%, var(--secondary-color) 50%, var(--accent-color) 100%);
-            opacity: 0.03;
-            z-index: -2;
-            animation: gradientShift 15s ease-in-out infinite;
-        }}
-
-        @keyframes gradientShift {{
-            0%, 100% {{ transform: translateX(0) translateY(0) rotate(0deg); }}
-            25% {{ transform: translateX(-5px) translateY(-5px) rotate(1deg); }}
-            50% {{ transform: translateX(5px) translateY(-10px) rotate(-1deg); }}
-            75% {{ transform: translateX(-3px) translateY(5px) rotate(0.5deg); }}
-        }}
-
-        .particles {{
-            position: fixed;
-            top: 0;
-            left: 0;
-            width: 100%;
-            height: 100%;
-            pointer-events: none;
-            z-index: -1;
-        }}
-
-        .particle {{
-            position: absolute;
-            width: 2px;
-            height: 2px;
-            background: var(--primary-color);
-            border-radius: 50%;
-            opacity: 0.6;
-            animation: float 6s ease-in-out infinite;
-        }}
-
-        @keyframes float {{
-            0%, 100% {{ transform: translateY(0px) rotate(0deg); opacity: 0; }}
-            10% {{ opacity: 0.6; }}
-            90% {{ opacity: 0.6; }}
-            50% {{ transform: translateY(-20px) rotate(180deg); }}
-        }}
-
-        .theme-toggle {{
-            position: fixed;
-            top: 30px;
-            right: 30px;
-            z-index: 1000;
-            background: var(--glass-bg);
-            backdrop-filter: blur(20px);
-            border: 1px solid var(--glass-border);
-            border-radius: 50px;
-            padding: 12px 20px;
-            cursor: pointer;
-            transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1);
-            box-shadow: var(--shadow-light);
-            display: flex;
-            align-items: center;
-            gap: 8px;
-            font-size: 14px;
-            font-weight: 600;
-            color: var(--text-primary);
-        }}
-
-        .theme-toggle:hover {{
-            transform: translateY(-2px);
-            box-shadow: var(--shadow-medium);
-            background: var(--glass-bg);
-        }}
-
-        .theme-toggle i {{
-            font-size: 16px;
-            transition: transform 0.3s ease;
-        }}
-
-        .theme-toggle:hover i {{
-            transform: rotate(180deg);
-        }}
-
-        .page-enter {{
-            animation: pageEnter 0.8s cubic-bezier(0.4, 0, 0.2, 1);
-        }}
-
-        @keyframes pageEnter {{
-            from {{
-                opacity: 0;
-                transform: translateY(30px);
-            }}
-            to {{
-                opacity: 1;
-                transform: translateY(0);
-            }}
-        }}
-        
-        .header {{
-            background: linear-gradient(135deg, var(--primary-color) 0%, var(--secondary-color) 50%, var(--accent-color) 100%);
-            color: white;
-            padding: 40px;
-            border-radius: 24px;
-            margin-bottom: 40px;
-            box-shadow: var(--shadow-heavy);
-            text-align: center;
-            position: relative;
-            overflow: hidden;
-            backdrop-filter: blur(20px);
-            border: 1px solid rgba(255, 255, 255, 0.1);
-            animation: headerGlow 4s ease-in-out infinite alternate;
-        }}
-
-        .header::before {{
-            content: '';
-            position: absolute;
-            top: -50%;
-            left: -50%;
-            width: 200%;
-            height: 200%;
-            background: radial-gradient(circle, rgba(255,255,255,0.1) 0%, transparent 70%);
-            animation: headerShine 8s linear infinite;
-            pointer-events: none;
-        }}
-
-        @keyframes headerGlow {{
-            0% {{ box-shadow: var(--shadow-heavy), 0 0 30px rgba(102, 126, 234, 0.3); }}
-            100% {{ box-shadow: var(--shadow-heavy), 0 0 50px rgba(118, 75, 162, 0.4); }}
-        }}
-
-        @keyframes headerShine {{
-            0% {{ transform: rotate(0deg); }}
-            100% {{ transform: rotate(360deg); }}
-        }}
-        
-        .header h1 {{
-            font-size: 3em;
-            margin-bottom: 15px;
-            font-weight: 800;
-            background: linear-gradient(45deg, #ffffff, #f0f8ff, #ffffff);
-            background-size: 200% 200%;
-            -webkit-background-clip: text;
-            -webkit-text-fill-color: transparent;
-            background-clip: text;
-            animation: textShimmer 3s ease-in-out infinite;
-            position: relative;
-            z-index: 1;
-        }}
-
-        @keyframes textShimmer {{
-            0%, 100% {{ background-position: 0% 50%; }}
-            50% {{ background-position: 100% 50%; }}
-        }}
-        
-        .header p {{
-            font-size: 1.3em;
-            opacity: 0.95;
-            margin-bottom: 30px;
-            font-weight: 500;
-            position: relative;
-            z-index: 1;
-        }}
-        
-        .header .stats {{
-            display: flex;
-            gap: 20px;
-            margin-top: 30px;
-            flex-wrap: wrap;
-            justify-content: center;
-            position: relative;
-            z-index: 1;
-        }}
-        
-        .stat-card {{
-            background: var(--glass-bg);
-            backdrop-filter: blur(20px);
-            padding: 20px 30px;
-            border-radius: 16px;
-            border: 1px solid var(--glass-border);
-            transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1);
-            cursor: pointer;
-            position: relative;
-            overflow: hidden;
-        }}
-
-        .stat-card::before {{
-            content: '';
-            position: absolute;
-            top: 0;
-            left: -100%;
-            width: 100%;
-            height: 100%;
-            background: linear-gradient(90deg, transparent, rgba(255,255,255,0.2), transparent);
-            transition: left 0.5s;
-        }}
-
-        .stat-card:hover::before {{
-            left: 100%;
-        }}
-
-        .stat-card:hover {{
-            transform: translateY(-5px) scale(1.05);
-            box-shadow: 0 20px 40px rgba(0,0,0,0.2);
-        }}
-        
-        .stat-card .label {{
-            font-size: 0.95em;
-            opacity: 0.9;
-            font-weight: 600;
-            text-transform: uppercase;
-            letter-spacing: 0.5px;
-        }}
-        
-        .stat-card .value {{
-            font-size: 2.5em;
-            font-weight: 900;
-            margin-top: 8px;
-            line-height: 1;
-            position: relative;
-            z-index: 1;
-        }}
-        
-        .controls {{
-            background: var(--glass-bg);
-            backdrop-filter: blur(20px);
-            padding: 30px;
-            border-radius: 20px;
-            margin-bottom: 40px;
-            box-shadow: var(--shadow-medium);
-            border: 1px solid var(--glass-border);
-            transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1);
-        }}
-
-        .controls:hover {{
-            transform: translateY(-2px);
-            box-shadow: var(--shadow-heavy);
-        }}
-        
-        .search-box {{
-            width: 100%;
-            padding: 16px 24px;
-            font-size: 16px;
-            border: 2px solid var(--border-color);
-            border-radius: 12px;
-            margin-bottom: 25px;
-            transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1);
-            background: var(--bg-secondary);
-            color: var(--text-primary);
-            box-shadow: var(--shadow-light);
-        }}
-        
-        .search-box:focus {{
-            outline: none;
-            border-color: var(--primary-color);
-            box-shadow: 0 0 0 3px rgba(102, 126, 234, 0.1);
-            transform: translateY(-1px);
-        }}
-
-        .search-box::placeholder {{
-            color: var(--text-secondary);
-        }}
-        
-        .filters {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: 15px;
-            margin-bottom: 15px;
-        }}
-        
-        .filter-group {{
-            display: flex;
-            flex-direction: column;
-        }}
-        
-        .filter-group label {{
-            font-weight: 600;
-            margin-bottom: 5px;
-            font-size: 0.9em;
-            color: var(--text-primary);
-        }}
-        
-        .filter-group select {{
-            padding: 12px 16px;
-            border: 2px solid var(--border-color);
-            border-radius: 10px;
-            font-size: 14px;
-            background: var(--bg-secondary);
-            color: var(--text-primary);
-            cursor: pointer;
-            transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1);
-            box-shadow: var(--shadow-light);
-        }}
-        
-        .filter-group select:focus {{
-            outline: none;
-            border-color: var(--primary-color);
-            box-shadow: 0 0 0 3px rgba(102, 126, 234, 0.1);
-            transform: translateY(-1px);
-        }}
-
-        .filter-group select:hover {{
-            border-color: var(--primary-color);
-        }}
-
-        .filter-group label {{
-            font-weight: 600;
-            margin-bottom: 8px;
-            font-size: 0.9em;
-            color: var(--text-primary);
-            text-transform: uppercase;
-            letter-spacing: 0.5px;
-        }}
-        
-        .reset-btn {{
-            padding: 12px 24px;
-            background: linear-gradient(135deg, var(--primary-color) 0%, var(--secondary-color) 100%);
-            color: white;
-            border: none;
-            border-radius: 12px;
-            cursor: pointer;
-            font-size: 14px;
-            font-weight: 600;
-            transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1);
-            margin-top: 15px;
-            box-shadow: var(--shadow-light);
-            position: relative;
-            overflow: hidden;
-        }}
-
-        .reset-btn::before {{
-            content: '';
-            position: absolute;
-            top: 0;
-            left: -100%;
-            width: 100%;
-            height: 100%;
-            background: linear-gradient(90deg, transparent, rgba(255,255,255,0.2), transparent);
-            transition: left 0.5s;
-        }}
-
-        .reset-btn:hover::before {{
-            left: 100%;
-        }}
-        
-        .reset-btn:hover {{
-            transform: translateY(-2px);
-            box-shadow: var(--shadow-medium);
-        }}
-
-        .reset-btn:active {{
-            transform: translateY(0);
-        }}
-        
-        .section {{
-            background: var(--glass-bg);
-            backdrop-filter: blur(20px);
-            padding: 30px;
-            border-radius: 20px;
-            box-shadow: var(--shadow-medium);
-            border: 1px solid var(--glass-border);
-            transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1);
-        }}
-
-        .section:hover {{
-            transform: translateY(-2px);
-            box-shadow: var(--shadow-heavy);
-        }}
-        
-        .tabs-header {{
-            display: flex;
-            align-items: center;
-            gap: 30px;
-            margin-bottom: 20px;
-            border-bottom: 2px solid var(--border-color);
-            padding-bottom: 10px;
-        }}
-        
-        .tab-group-title {{
-            font-size: 1.2em;
-            font-weight: 600;
-            color: var(--text-primary);
-            padding: 10px 0;
-        }}
-        
-        .tab-group-title.active {{
-            color: var(--primary-color);
-            border-bottom: 3px solid var(--primary-color);
-            margin-bottom: -12px;
-        }}
-        
-        .tabs-container {{
-            width: 100%;
-        }}
-        
-        .tabs {{
-            display: flex;
-            flex-wrap: wrap;
-            gap: 5px;
-            margin-bottom: 20px;
-        }}
-        
-        .tab {{
-            padding: 14px 28px;
-            background: var(--bg-secondary);
-            border: 2px solid var(--border-color);
-            cursor: pointer;
-            font-size: 14px;
-            font-weight: 600;
-            color: var(--text-secondary);
-            border-radius: 12px;
-            transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1);
-            position: relative;
-            box-shadow: var(--shadow-light);
-            overflow: hidden;
-        }}
-
-        .tab::before {{
-            content: '';
-            position: absolute;
-            top: 0;
-            left: -100%;
-            width: 100%;
-            height: 100%;
-            background: linear-gradient(90deg, transparent, rgba(102, 126, 234, 0.1), transparent);
-            transition: left 0.5s;
-        }}
-
-        .tab:hover::before {{
-            left: 100%;
-        }}
-        
-        .tab:hover {{
-            background: var(--bg-tertiary);
-            color: var(--text-primary);
-            border-color: var(--primary-color);
-            transform: translateY(-2px);
-            box-shadow: var(--shadow-medium);
-        }}
-        
-        .tab.active {{
-            background: linear-gradient(135deg, var(--primary-color) 0%, var(--secondary-color) 100%);
-            color: white;
-            border-color: var(--primary-color);
-            box-shadow: var(--shadow-heavy);
-            transform: translateY(-2px);
-        }}
-
-        .tab.active::before {{
-            display: none;
-        }}
-        
-        .tab .count {{
-            display: inline-block;
-            background: rgba(0,0,0,0.15);
-            padding: 2px 8px;
-            border-radius: 12px;
-            font-size: 0.85em;
-            margin-left: 8px;
-        }}
-        
-        .tab.active .count {{
-            background: rgba(255,255,255,0.3);
-        }}
-        
-        .tab-content {{
-            display: none;
-        }}
-        
-        .tab-content.active {{
-            display: block;
-            animation: fadeIn 0.3s;
-        }}
-        
-        @keyframes fadeIn {{
-            from {{
-                opacity: 0;
-                transform: translateY(10px);
-            }}
-            to {{
-                opacity: 1;
-                transform: translateY(0);
-            }}
-        }}
-        
-        .table-wrapper {{
-            max-height: 600px;
-            overflow: auto;
-            border: 1px solid var(--border-color);
-            border-radius: 8px;
-            position: relative;
-        }}
-        
-        .table-wrapper::-webkit-scrollbar {{
-            width: 10px;
-            height: 10px;
-        }}
-        
-        .table-wrapper::-webkit-scrollbar-track {{
-            background: #f1f1f1;
-            border-radius: 10px;
-        }}
-        
-        .table-wrapper::-webkit-scrollbar-thumb {{
-            background: #888;
-            border-radius: 10px;
-        }}
-        
-        .table-wrapper::-webkit-scrollbar-thumb:hover {{
-            background: #555;
-        }}
-        
-        table {{
-            width: 100%;
-            border-collapse: collapse;
-            table-layout: auto;
-        }}
-        
-        th {{
-            background: var(--bg-tertiary);
-            padding: 12px 8px;
-            text-align: left;
-            font-weight: 600;
-            color: var(--text-primary);
-            border-bottom: 2px solid var(--border-color);
-            position: sticky;
-            top: 0;
-            white-space: nowrap;
-            overflow: hidden;
-            user-select: none;
-            z-index: 10;
-            position: relative;
-        }}
-        
-        th:hover {{
-            background: var(--bg-secondary);
-        }}
-        
-        th .resize-handle {{
-            position: absolute;
-            right: 0;
-            top: 0;
-            bottom: 0;
-            width: 8px;
-            cursor: col-resize;
-            user-select: none;
-            z-index: 1;
-        }}
-        
-        th .resize-handle:hover {{
-            background: var(--primary-color);
-            opacity: 0.5;
-        }}
-        
-        th.resizing {{
-            background: var(--bg-secondary);
-        }}
-        
-        th.resizing .resize-handle {{
-            background: var(--primary-color);
-            opacity: 0.8;
-        }}
-        
-        td {{
-            padding: 12px 8px;
-            border-bottom: 1px solid var(--border-color);
-            overflow: hidden;
-            text-overflow: ellipsis;
-            color: var(--text-primary);
-        }}
-        
-        tr:hover {{
-            background: var(--bg-tertiary);
-        }}
-        
-        tr:last-child td {{
-            border-bottom: none;
-        }}
-        
-        .col-service-id {{ min-width: 80px; width: 80px; }}
-        .col-series-id {{ min-width: 150px; width: 150px; }}
-        .col-type {{ min-width: 100px; width: 100px; }}
-        .col-root-id {{ min-width: 120px; width: 120px; }}
-        .col-venue {{ min-width: 100px; width: 100px; }}
-        .col-schema {{ min-width: 120px; width: 120px; }}
-        .col-source {{ min-width: 120px; width: 120px; }}
-        .col-destination {{ min-width: 150px; width: 150px; }}
-        .col-extractor {{ min-width: 100px; width: 100px; }}
-        .col-description {{ min-width: 250px; width: 250px; }}
-        .col-symbol {{ min-width: 100px; width: 100px; }}
-        .col-params {{ min-width: 150px; width: 150px; }}
-        .col-status {{ min-width: 80px; width: 80px; }}
-        
-        .badge {{
-            display: inline-block;
-            padding: 4px 10px;
-            border-radius: 4px;
-            font-size: 0.85em;
-            font-weight: 600;
-            text-transform: uppercase;
-        }}
-        
-        .badge-active {{
-            background: var(--bg-tertiary);
-            color: var(--success-color);
-            border: 1px solid var(--border-color);
-        }}
-        
-        .badge-inactive {{
-            background: var(--bg-tertiary);
-            color: var(--error-color);
-            border: 1px solid var(--border-color);
-        }}
-        
-        .json-preview {{
-            font-family: 'Courier New', monospace;
-            font-size: 0.85em;
-            background: var(--bg-tertiary);
-            color: var(--text-primary);
-            padding: 6px 10px;
-            border-radius: 4px;
-            border: 1px solid var(--border-color);
-            overflow: hidden;
-            text-overflow: ellipsis;
-            white-space: nowrap;
-            cursor: help;
-            display: block;
-        }}
-        
-        .json-preview:hover {{
-            background: var(--bg-secondary);
-        }}
-        
-        .series-id {{
-            font-weight: 600;
-            color: var(--primary-color);
-        }}
-        
-        .service-id {{
-            font-family: 'Courier New', monospace;
-            font-size: 0.9em;
-            color: var(--text-secondary);
-        }}
-        
-        .extractor-type {{
-            padding: 3px 8px;
-            border-radius: 3px;
-            font-size: 0.85em;
-            font-weight: 500;
-        }}
-        
-        .extractor-realtime {{
-            background: var(--bg-tertiary);
-            color: var(--primary-color);
-            border: 1px solid var(--border-color);
-        }}
-        
-        .extractor-historical {{
-            background: var(--bg-tertiary);
-            color: var(--secondary-color);
-            border: 1px solid var(--border-color);
-        }}
-        
-        .venue-badge {{
-            padding: 3px 8px;
-            border-radius: 3px;
-            font-size: 0.85em;
-            font-weight: 500;
-            background: var(--bg-tertiary);
-            color: var(--warning-color);
-            border: 1px solid var(--border-color);
-        }}
-        
-        .source-badge {{
-            padding: 3px 8px;
-            border-radius: 3px;
-            font-size: 0.85em;
-            font-weight: 500;
-            background: var(--bg-tertiary);
-            color: var(--success-color);
-            border: 1px solid var(--border-color);
-        }}
-        
-        .no-results {{
-            text-align: center;
-            padding: 40px;
-            color: var(--text-secondary);
-            font-size: 1.1em;
-        }}
-        
-        .empty-tab {{
-            text-align: center;
-            padding: 60px 20px;
-            color: var(--text-secondary);
-        }}
-        
-        .empty-tab-icon {{
-            font-size: 3em;
-            margin-bottom: 10px;
-        }}
-        
-        .group-switcher {{
-            display: flex;
-            gap: 10px;
-            margin-bottom: 20px;
-            border-bottom: 2px solid var(--border-color);
-        }}
-        
-        .group-btn {{
-            padding: 12px 24px;
-            background: transparent;
-            border: none;
-            cursor: pointer;
-            font-size: 1.1em;
-            font-weight: 600;
-            color: var(--text-secondary);
-            border-bottom: 3px solid transparent;
-            margin-bottom: -2px;
-            transition: all 0.3s;
-        }}
-        
-        .group-btn:hover {{
-            color: var(--primary-color);
-        }}
-        
-        .group-btn.active {{
-            color: var(--primary-color);
-            border-bottom-color: var(--primary-color);
-        }}
-        
-        @media (max-width: 768px) {{
-            .header h1 {{
-                font-size: 1.8em;
-            }}
-            
-            .filters {{
-                grid-template-columns: 1fr;
-            }}
-            
-            .tabs {{
-                overflow-x: auto;
-                flex-wrap: nowrap;
-            }}
-            
-            .tab {{
-                padding: 10px 16px;
-                font-size: 13px;
-                white-space: nowrap;
-            }}
-            
-            table {{
-                font-size: 0.85em;
-            }}
-            
-            .table-wrapper {{
-                max-height: 400px;
-            }}
-        }}
-    </style>
-</head>
-<body class="page-enter">
-    <div class="particles" id="particles"></div>
-    
-    <div class="theme-toggle" onclick="toggleTheme()">
-        <i class="fas fa-moon" id="themeIcon"></i>
-        <span id="themeText">Dark Mode</span>
-    </div>
-    
-    <div class="header">
-        <h1>Time Series Configuration Dashboard</h1>
-        <p>Realtime and Historical Data Service</p>
-        <div class="stats">
-            <div class="stat-card">
-                <div class="label">Total Series</div>
-                <div class="value" id="totalCount">{len(time_series)}</div>
-            </div>
-            <div class="stat-card">
-                <div class="label">Venues</div>
-                <div class="value">{len(venues)}</div>
-            </div>
-            <div class="stat-card">
-                <div class="label">Data Sources</div>
-                <div class="value">{len(sources)}</div>
-            </div>
-            <div class="stat-card">
-                <div class="label">Active</div>
-                <div class="value">{sum(1 for ts in time_series if ts.active)}</div>
-            </div>
-        </div>
-    </div>
-    
-    <div class="controls">
-        <input type="text" id="searchBox" class="search-box" placeholder="Search across all fields...">
-        
-        <div class="filters">
-            <div class="filter-group">
-                <label>Venue</label>
-                <select id="filterVenue">
-                    <option value="">All Venues</option>
-                </select>
-            </div>
-            <div class="filter-group">
-                <label>Data Source</label>
-                <select id="filterSource">
-                    <option value="">All Sources</option>
-                </select>
-            </div>
-            <div class="filter-group">
-                <label>Series Type</label>
-                <select id="filterSeriesType">
-                    <option value="">All Types</option>
-                </select>
-            </div>
-            <div class="filter-group">
-                <label>Extractor</label>
-                <select id="filterExtractor">
-                    <option value="">All Extractors</option>
-                </select>
-            </div>
-            <div class="filter-group">
-                <label>Data Schema</label>
-                <select id="filterSchema">
-                    <option value="">All Schemas</option>
-                </select>
-            </div>
-            <div class="filter-group">
-                <label>Status</label>
-                <select id="filterActive">
-                    <option value="">All Status</option>
-                    <option value="true">Active</option>
-                    <option value="false">Inactive</option>
-                </select>
-            </div>
-        </div>
-        
-        <button class="reset-btn" onclick="resetFilters()">Reset All Filters</button>
-    </div>
+        active = ts.active
+        schema = ts.data_schema
+        params = ts.additional_params
+        # values in ROW_KEYS order
+        rows.append([
+            ts.service_id,
+            ts.series_id,
+            ts.series_type,
+            ts.root_id,
+            venue,
+            schema.value if isinstance(schema, Enum) else str(schema),
+            source,
+            ts.destination_str,
+            ts.extractor,
+            ts.description or '',
+            to_json(params) if params else '{}',
+            ts.symbol or '',
+            active,
+        ])
+        venues.add(venue)
+        sources.add(source)
+        if active:
+            active_count += 1
     
-    <div class="section">
-        <div class="group-switcher">
-            <button class="group-btn active" id="btnVenue" onclick="switchGroup('venue')">Grouped by Venue</button>
-            <button class="group-btn" id="btnSource" onclick="switchGroup('source')">Grouped by Data Source</button>
-        </div>
-        
-        <div class="tabs-container">
-            <div class="tabs" id="tabsBar"></div>
-            <div id="tabsContent"></div>
-        </div>
-    </div>
-    
-    <script>
-        const timeSeriesData = {json.dumps(ts_data, indent=2)};
-        let currentGroup = 'venue';
-        let currentTab = null;
-
-        // Theme management
-        function toggleTheme() {{
-            const body = document.body;
-            const themeIcon = document.getElementById('themeIcon');
-            const themeText = document.getElementById('themeText');
-            
-            if (body.getAttribute('data-theme') === 'dark') {{
-                body.removeAttribute('data-theme');
-                themeIcon.className = 'fas fa-moon';
-                themeText.textContent = 'Dark Mode';
-                localStorage.setItem('theme', 'light');
-            }} else {{
-                body.setAttribute('data-theme', 'dark');
-                themeIcon.className = 'fas fa-sun';
-                themeText.textContent = 'Light Mode';
-                localStorage.setItem('theme', 'dark');
-            }}
-        }}
-
-        // Initialize theme from localStorage
-        function initTheme() {{
-            const savedTheme = localStorage.getItem('theme');
-            if (savedTheme === 'dark') {{
-                document.body.setAttribute('data-theme', 'dark');
-                document.getElementById('themeIcon').className = 'fas fa-sun';
-                document.getElementById('themeText').textContent = 'Light Mode';
-            }}
-        }}
-
-        // Particle system
-        function createParticles() {{
-            const particlesContainer = document.getElementById('particles');
-            const particleCount = 50;
-            
-            for (let i = 0; i < particleCount; i++) {{
-                const particle = document.createElement('div');
-                particle.className = 'particle';
-                particle.style.left = Math.random() * 100 + '%';
-                particle.style.top = Math.random() * 100 + '%';
-                particle.style.animationDelay = Math.random() * 6 + 's';
-                particle.style.animationDuration = (Math.random() * 3 + 3) + 's';
-                particlesContainer.appendChild(particle);
-            }}
-        }}
-
-        // Animated counter
-        function animateCounter(element, target) {{
-            const start = 0;
-            const duration = 2000;
-            const startTime = performance.now();
-            
-            function updateCounter(currentTime) {{
-                const elapsed = currentTime - startTime;
-                const progress = Math.min(elapsed / duration, 1);
-                
-                // Easing function for smooth animation
-                const easeOutQuart = 1 - Math.pow(1 - progress, 4);
-                const current = Math.floor(start + (target - start) * easeOutQuart);
-                
-                element.textContent = current.toLocaleString();
-                
-                if (progress < 1) {{
-                    requestAnimationFrame(updateCounter);
-                }}
-            }}
-            
-            requestAnimationFrame(updateCounter);
-        }}
-
-        // Initialize animated counters
-        function initCounters() {{
-            const counters = document.querySelectorAll('.stat-card .value');
-            counters.forEach(counter => {{
-                const target = parseInt(counter.textContent);
-                if (!isNaN(target)) {{
-                    counter.textContent = '0';
-                    setTimeout(() => animateCounter(counter, target), 500);
-                }}
-            }});
-        }}
-
-        // Initialize everything when page loads
-        document.addEventListener('DOMContentLoaded', function() {{
-            initTheme();
-            createParticles();
-            initCounters();
-        }});
-        
-        function populateFilters() {{
-            const venues = new Set();
-            const sources = new Set();
-            const seriesTypes = new Set();
-            const extractors = new Set();
-            const schemas = new Set();
-            
-            timeSeriesData.forEach(ts => {{
-                venues.add(ts.venue);
-                sources.add(ts.data_source);
-                seriesTypes.add(ts.series_type);
-                extractors.add(ts.extractor);
-                schemas.add(ts.data_schema);
-            }});
-            
-            populateSelect('filterVenue', Array.from(venues).sort());
-            populateSelect('filterSource', Array.from(sources).sort());
-            populateSelect('filterSeriesType', Array.from(seriesTypes).sort());
-            populateSelect('filterExtractor', Array.from(extractors).sort());
-            populateSelect('filterSchema', Array.from(schemas).sort());
-        }}
-        
-        function populateSelect(id, options) {{
-            const select = document.getElementById(id);
-            options.forEach(option => {{
-                const opt = document.createElement('option');
-                opt.value = option;
-                opt.textContent = option;
-                select.appendChild(opt);
-            }});
-        }}
-        
-        function filterData() {{
-            const searchTerm = document.getElementById('searchBox').value.toLowerCase();
-            const venue = document.getElementById('filterVenue').value;
-            const source = document.getElementById('filterSource').value;
-            const seriesType = document.getElementById('filterSeriesType').value;
-            const extractor = document.getElementById('filterExtractor').value;
-            const schema = document.getElementById('filterSchema').value;
-            const active = document.getElementById('filterActive').value;
-            
-            let filtered = timeSeriesData.filter(ts => {{
-                const searchMatch = !searchTerm || Object.values(ts).some(val => 
-                    String(val).toLowerCase().includes(searchTerm)
-                );
-                
-                const venueMatch = !venue || ts.venue === venue;
-                const sourceMatch = !source || ts.data_source === source;
-                const typeMatch = !seriesType || ts.series_type === seriesType;
-                const extractorMatch = !extractor || ts.extractor === extractor;
-                const schemaMatch = !schema || ts.data_schema === schema;
-                const activeMatch = !active || String(ts.active) === active;
-                
-                return searchMatch && venueMatch && sourceMatch && typeMatch && 
-                       extractorMatch && schemaMatch && activeMatch;
-            }});
-            
-            document.getElementById('totalCount').textContent = filtered.length;
-            renderTabs(filtered);
-        }}
-        
-        function switchGroup(group) {{
-            currentGroup = group;
-            document.getElementById('btnVenue').classList.toggle('active', group === 'venue');
-            document.getElementById('btnSource').classList.toggle('active', group === 'source');
-            filterData();
-        }}
-        
-        function renderTabs(data) {{
-            const groupKey = currentGroup === 'venue' ? 'venue' : 'data_source';
-            const grouped = {{}};
-            
-            data.forEach(ts => {{
-                const key = ts[groupKey];
-                if (!grouped[key]) grouped[key] = [];
-                grouped[key].push(ts);
-            }});
-            
-            const tabsBar = document.getElementById('tabsBar');
-            const tabsContent = document.getElementById('tabsContent');
-            
-            tabsBar.innerHTML = '';
-            tabsContent.innerHTML = '';
-            
-            if (Object.keys(grouped).length === 0) {{
-                tabsContent.innerHTML = '<div class="no-results">No results found</div>';
-                return;
-            }}
-            
-            const sortedKeys = Object.keys(grouped).sort();
-            
-            sortedKeys.forEach((key, index) => {{
-                const group = grouped[key];
-                const tabButton = document.createElement('button');
-                tabButton.className = 'tab' + (index === 0 ? ' active' : '');
-                tabButton.innerHTML = `
-                    ${{key}}
-                    <span class="count">${{group.length}}</span>
-                `;
-                tabButton.onclick = () => switchTab(key);
-                tabsBar.appendChild(tabButton);
-                
-                const tabContent = document.createElement('div');
-                tabContent.className = 'tab-content' + (index === 0 ? ' active' : '');
-                tabContent.id = `tab-${{key}}`;
-                
-                if (group.length === 0) {{
-                    tabContent.innerHTML = `
-                        <div class="empty-tab">
-                            <div class="empty-tab-icon">📭</div>
-                            <div>No time series found</div>
-                        </div>
-                    `;
-                }} else {{
-                    tabContent.innerHTML = `
-                        <div class="table-wrapper">
-                            <table>
-                                <thead>
-                                    <tr>
-                                        <th class="col-service-id">Service ID<div class="resize-handle"></div></th>
-                                        <th class="col-series-id">Series ID<div class="resize-handle"></div></th>
-                                        <th class="col-type">Type<div class="resize-handle"></div></th>
-                                        <th class="col-root-id">Root ID<div class="resize-handle"></div></th>
-                                        <th class="col-venue">Venue<div class="resize-handle"></div></th>
-                                        <th class="col-schema">Schema<div class="resize-handle"></div></th>
-                                        <th class="col-source">Source<div class="resize-handle"></div></th>
-                                        <th class="col-destination">Destination<div class="resize-handle"></div></th>
-                                        <th class="col-extractor">Extractor<div class="resize-handle"></div></th>
-                                        <th class="col-description">Description<div class="resize-handle"></div></th>
-                                        <th class="col-symbol">Symbol<div class="resize-handle"></div></th>
-                                        <th class="col-params">Additional Params<div class="resize-handle"></div></th>
-                                        <th class="col-status">Status<div class="resize-handle"></div></th>
-                                    </tr>
-                                </thead>
-                                <tbody>
-                                    ${{group.map(ts => `
-                                        <tr>
-                                            <td class="service-id">${{ts.service_id}}</td>
-                                            <td><span class="series-id">${{ts.series_id}}</span></td>
-                                            <td>${{ts.series_type.toUpperCase()}}</td>
-                                            <td>${{ts.root_id}}</td>
-                                            <td><span class="venue-badge">${{ts.venue}}</span></td>
-                                            <td>${{ts.data_schema}}</td>
-                                            <td><span class="source-badge">${{ts.data_source}}</span></td>
-                                            <td>${{ts.destination}}</td>
-                                            <td><span class="extractor-type extractor-${{ts.extractor}}">${{ts.extractor}}</span></td>
-                                            <td>${{ts.description}}</td>
-                                            <td>${{ts.symbol || '-'}}</td>
-                                            <td><span class="json-preview" title="${{ts.additional_params}}">${{ts.additional_params}}</span></td>
-                                            <td><span class="badge ${{ts.active ? 'badge-active' : 'badge-inactive'}}">${{ts.active ? 'Active' : 'Inactive'}}</span></td>
-                                        </tr>
-                                    `).join('')}}
-                                </tbody>
-                            </table>
-                        </div>
-                    `;
-                }}
-                
-                tabsContent.appendChild(tabContent);
-            }});
-            
-            currentTab = sortedKeys[0];
-            
-            // Initialize column resizing after rendering
-            initColumnResize();
-        }}
-        
-        function initColumnResize() {{
-            const tables = document.querySelectorAll('table');
-            
-            tables.forEach(table => {{
-                const cols = table.querySelectorAll('th');
-                
-                cols.forEach((col, colIndex) => {{
-                    const resizeHandle = col.querySelector('.resize-handle');
-                    if (!resizeHandle) return;
-                    
-                    let startX, startWidth;
-                    
-                    const onMouseDown = (e) => {{
-                        e.preventDefault();
-                        e.stopPropagation();
-                        
-                        startX = e.pageX;
-                        startWidth = col.offsetWidth;
-                        
-                        col.classList.add('resizing');
-                        document.body.style.cursor = 'col-resize';
-                        document.body.style.userSelect = 'none';
-                        
-                        document.addEventListener('mousemove', onMouseMove);
-                        document.addEventListener('mouseup', onMouseUp);
-                    }};
-                    
-                    const onMouseMove = (e) => {{
-                        const diff = e.pageX - startX;
-                        const newWidth = Math.max(50, startWidth + diff);
-                        
-                        col.style.width = newWidth + 'px';
-                        col.style.minWidth = newWidth + 'px';
-                        
-                        // Apply same width to all cells in this column
-                        const rows = table.querySelectorAll('tr');
-                        rows.forEach(row => {{
-                            const cell = row.children[colIndex];
-                            if (cell) {{
-                                cell.style.width = newWidth + 'px';
-                                cell.style.minWidth = newWidth + 'px';
-                            }}
-                        }});
-                    }};
-                    
-                    const onMouseUp = () => {{
-                        col.classList.remove('resizing');
-                        document.body.style.cursor = '';
-                        document.body.style.userSelect = '';
-                        
-                        document.removeEventListener('mousemove', onMouseMove);
-                        document.removeEventListener('mouseup', onMouseUp);
-                    }};
-                    
-                    resizeHandle.addEventListener('mousedown', onMouseDown);
-                }});
-            }});
-        }}
-        
-        function switchTab(tabKey) {{
-            const tabs = document.getElementById('tabsBar').querySelectorAll('.tab');
-            tabs.forEach(tab => {{
-                if (tab.textContent.trim().startsWith(tabKey)) {{
-                    tab.classList.add('active');
-                }} else {{
-                    tab.classList.remove('active');
-                }}
-            }});
-            
-            const contents = document.getElementById('tabsContent').querySelectorAll('.tab-content');
-            contents.forEach(content => {{
-                if (content.id === `tab-${{tabKey}}`) {{
-                    content.classList.add('active');
-                }} else {{
-                    content.classList.remove('active');
-                }}
-            }});
-            
-            currentTab = tabKey;
-        }}
-        
-        function resetFilters() {{
-            document.getElementById('searchBox').value = '';
-            document.getElementById('filterVenue').value = '';
-            document.getElementById('filterSource').value = '';
-            document.getElementById('filterSeriesType').value = '';
-            document.getElementById('filterExtractor').value = '';
-            document.getElementById('filterSchema').value = '';
-            document.getElementById('filterActive').value = '';
-            filterData();
-        }}
-        
-        // Event listeners
-        document.getElementById('searchBox').addEventListener('input', filterData);
-        document.getElementById('filterVenue').addEventListener('change', filterData);
-        document.getElementById('filterSource').addEventListener('change', filterData);
-        document.getElementById('filterSeriesType').addEventListener('change', filterData);
-        document.getElementById('filterExtractor').addEventListener('change', filterData);
-        document.getElementById('filterSchema').addEventListener('change', filterData);
-        document.getElementById('filterActive').addEventListener('change', filterData);
-        
-        // Initialize
-        populateFilters();
-        renderTabs(timeSeriesData);
-    </script>
-</body>
-</html>
-"""
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(html_content)
+    head = DASHBOARD_HEAD.substitute(
+        css=DASHBOARD_CSS,
+        total_count=len(time_series),
+        venue_count=len(venues),
+        source_count=len(sources),
+        active_count=active_count,
+    )
+    with open(output_path, 'wb', buffering=1 << 20) as f:
+        f.write(head.encode("utf-8"))
+        f.write(encode_payload(to_json_bytes({'cols': ROW_KEYS, 'rows': rows})))
+        f.write(DASHBOARD_TAIL)
 
     logger.info(f"✅ Dashboard generated: {output_path.absolute()}")
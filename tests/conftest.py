@@ -0,0 +1,6 @@
+import os
+
+# Settings are instantiated at import, provide the values normally supplied by config/.env
+os.environ.setdefault("BPIPE_APP_NAME", "dataflow-test")
+# Keep tests off the user's on-disk symbol cache, tests that need one create their own
+os.environ["SYMBOL_CACHE_PATH"] = ""
@@ -0,0 +1,41 @@
+import logging
+
+import pandas as pd
+import pytest
+
+from dataflow.utils.bbg import group_option_chain
+
+
+def test_group_option_chain_keys_rows_by_symbol():
+    opt_chain = pd.DataFrame({
+        "SYMBOL": ["LPZ5 Comdty", "LPZ5 Comdty", "LAZ5 Comdty"],
+        "SECURITY_DESCRIPTION": ["LPZ5C  9000   Comdty", " LPZ5P 8500 Comdty ", "LAZ5C 2600 Comdty"],
+    })
+
+    chains = group_option_chain(opt_chain, ["LPZ5 Comdty", "LAZ5 Comdty"])
+
+    assert chains == {
+        "LPZ5 Comdty": ["LPZ5C 9000 Comdty", "LPZ5P 8500 Comdty"],
+        "LAZ5 Comdty": ["LAZ5C 2600 Comdty"],
+    }
+
+
+def test_group_option_chain_requires_symbol_column():
+    opt_chain = pd.DataFrame({"SECURITY_DESCRIPTION": ["LPZ5C 9000 Comdty"]})
+
+    with pytest.raises(ValueError, match="SYMBOL"):
+        group_option_chain(opt_chain, ["LPZ5 Comdty"])
+
+
+def test_group_option_chain_logs_futures_without_options(caplog):
+    opt_chain = pd.DataFrame({
+        "SYMBOL": ["LPZ5 COMDTY"],
+        "SECURITY_DESCRIPTION": ["LPZ5C 9000 Comdty"],
+    })
+
+    with caplog.at_level(logging.ERROR, logger="dataflow.utils.bbg"):
+        chains = group_option_chain(opt_chain, ["LPZ5 Comdty"])
+
+    assert chains == {"LPZ5 Comdty": []}
+    assert "unrequested symbols: ['LPZ5 COMDTY']" in caplog.text
+    assert "no options for ['LPZ5 Comdty']" in caplog.text
@@ -0,0 +1,56 @@
+import types
+import datetime as dt
+from zoneinfo import ZoneInfo
+
+from dataflow.utils import loop_control
+from dataflow.utils.loop_control import JobCountControl, RuntimeControl
+
+LONDON = ZoneInfo("Europe/London")
+
+
+def frozen_clock(monkeypatch, now: dt.datetime, monotonic: float = 1000.0):
+    monkeypatch.setattr(loop_control, "time", types.SimpleNamespace(
+        time=lambda: now.timestamp(),
+        monotonic=lambda: monotonic,
+    ))
+
+
+def test_runtime_window_spanning_dst_change_ends_at_wall_clock_end(monkeypatch):
+    # UK clocks go back on Sunday 2026-10-25, so Saturday 10:00 BST -> Monday 10:00 GMT is 49 hours
+    frozen_clock(monkeypatch, dt.datetime(2026, 10, 24, 10, 0, tzinfo=LONDON))
+    control = RuntimeControl(
+        start=dt.datetime(2026, 10, 24, 9, 0, tzinfo=LONDON),
+        end=dt.datetime(2026, 10, 26, 10, 0, tzinfo=LONDON),
+    )
+
+    assert control.remaining_seconds() == 49 * 3600
+
+
+def test_runtime_window_past_end_across_dst_change_stops(monkeypatch):
+    # Monday 09:30 GMT is after a Monday 09:00 end, even though the window started in BST
+    frozen_clock(monkeypatch, dt.datetime(2026, 10, 26, 9, 30, tzinfo=LONDON))
+    control = RuntimeControl(
+        start=dt.datetime(2026, 10, 24, 9, 0, tzinfo=LONDON),
+        end=dt.datetime(2026, 10, 26, 9, 0, tzinfo=LONDON),
+    )
+
+    assert control.remaining_seconds() == 0.0
+    assert not control.should_continue()
+
+
+def test_job_count_without_budget_keeps_no_backlog():
+    control = JobCountControl(max_jobs=None)
+    for _ in range(1000):
+        control.add_job_done()
+        control.on_job_finished()
+
+    assert control.should_continue()
+    assert len(control._finished) == 0
+
+
+def test_job_count_stops_at_budget():
+    control = JobCountControl(max_jobs=3)
+    control.add_job_done(2)
+    assert control.should_continue()
+    control.on_job_finished()
+    assert not control.should_continue()
@@ -0,0 +1,50 @@
+import logging
+import types
+
+import pytest
+
+from dataflow.symbology.onyx_resolver import OnyxSymbolResolve
+
+
+class FakeSession:
+    """Serves /tickers/live/<product> from `products`; products listed in `failing` always answer 503."""
+
+    def __init__(self, products, failing=()):
+        self.products = products
+        self.failing = set(failing)
+
+    def get(self, url):
+        product = url.rsplit("/", 1)[-1]
+        if product in self.failing:
+            return types.SimpleNamespace(status_code=503, reason="Service Unavailable", json=lambda: None)
+        return types.SimpleNamespace(status_code=200, reason="OK", json=lambda: self.products[product])
+
+
+@pytest.fixture
+def make_resolver():
+    def make(session):
+        # skip __init__, it builds a live requests session
+        resolver = OnyxSymbolResolve.__new__(OnyxSymbolResolve)
+        resolver.session = session
+        return resolver
+    return make
+
+
+def test_failing_product_does_not_abort_other_products(make_resolver, caplog):
+    session = FakeSession(
+        products={"NAPEW": [{"symbol": "NAPEW-F1"}, {"symbol": "NAPEW-F2"}]},
+        failing={"BRENT"},
+    )
+
+    with caplog.at_level(logging.ERROR):
+        mapping = make_resolver(session).resolve(["ONYX.NAPEW.2", "ONYX.BRENT.1", "ONYX.NAPEW.1"])
+
+    assert mapping == {"ONYX.NAPEW.1": "NAPEW-F1", "ONYX.NAPEW.2": "NAPEW-F2"}
+    assert "BRENT: HTTP 503: Service Unavailable" in caplog.text
+
+
+def test_session_returns_last_response_after_retries():
+    retry = OnyxSymbolResolve.create_session(types.SimpleNamespace(headers={})).get_adapter("https://onyx").max_retries
+
+    assert retry.total == 3
+    assert retry.raise_on_status is False
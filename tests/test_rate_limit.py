@@ -0,0 +1,73 @@
+import types
+
+import pytest
+
+from dataflow.utils import rate_limit
+from dataflow.utils.rate_limit import RateLimiter
+
+
+class FakeClock:
+    """monotonic()/sleep() pair; sleeping advances the clock unless `advance_on_sleep` is off."""
+
+    def __init__(self, advance_on_sleep: bool = True):
+        self.now = 100.0
+        self.sleeps = []
+        self.advance_on_sleep = advance_on_sleep
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(round(seconds, 6))
+        if self.advance_on_sleep:
+            self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(rate_limit, "time", types.SimpleNamespace(monotonic=fake.monotonic, sleep=fake.sleep))
+    return fake
+
+
+def test_burst_then_throttled_at_rate(clock):
+    limiter = RateLimiter(rate=5)
+
+    for _ in range(5):
+        limiter.acquire()
+    assert clock.sleeps == []
+
+    for _ in range(3):
+        limiter.acquire()
+    assert clock.sleeps == [0.2, 0.2, 0.2]
+
+
+def test_refill_after_idle_is_capped_at_burst(clock):
+    limiter = RateLimiter(rate=5, burst=2)
+    limiter.acquire()
+    limiter.acquire()
+
+    clock.now += 60
+    limiter.acquire()
+    limiter.acquire()
+    assert clock.sleeps == []
+
+    limiter.acquire()
+    assert clock.sleeps == [0.2]
+
+
+def test_waiting_callers_reserve_consecutive_slots(clock):
+    clock.advance_on_sleep = False  # callers that have not woken up yet
+    limiter = RateLimiter(rate=2, burst=1)
+
+    limiter.acquire()
+    limiter.acquire()
+    limiter.acquire()
+    assert clock.sleeps == [0.5, 1.0]
+
+
+def test_default_burst_and_rate_validation(clock):
+    assert RateLimiter(rate=5).capacity == 5
+    assert RateLimiter(rate=0.5).capacity == 1
+    with pytest.raises(ValueError):
+        RateLimiter(rate=0)
@@ -0,0 +1,92 @@
+import time
+import sqlite3
+
+import pytest
+
+from dataflow.symbology import cache as cache_module
+from dataflow.symbology.cache import SymbolCache, cached_resolution
+
+
+class FakeResolver:
+    """Resolves every symbol to its lower-case form, except those listed in `failing`."""
+
+    def __init__(self, failing=()):
+        self.failing = set(failing)
+        self.calls = 0
+
+    @cached_resolution
+    def resolve(self, input_symbols):
+        self.calls += 1
+        return {sym: sym.lower() for sym in input_symbols if sym not in self.failing}
+
+
+@pytest.fixture
+def symbol_cache(tmp_path, monkeypatch):
+    sc = SymbolCache(tmp_path / "symbols.sqlite", ttl_seconds=3600)
+    monkeypatch.setattr(cache_module, "get_symbol_cache", lambda: sc)
+    return sc
+
+
+def test_complete_result_is_served_from_cache(symbol_cache):
+    resolver = FakeResolver()
+
+    assert resolver.resolve(["A.B.1", "A.B.2"]) == {"A.B.1": "a.b.1", "A.B.2": "a.b.2"}
+    assert resolver.resolve(["A.B.2", "A.B.1"]) == {"A.B.1": "a.b.1", "A.B.2": "a.b.2"}
+    assert resolver.calls == 1
+
+
+def test_partial_result_is_not_cached(symbol_cache):
+    resolver = FakeResolver(failing={"A.B.2"})
+
+    assert resolver.resolve(["A.B.1", "A.B.2"]) == {"A.B.1": "a.b.1"}
+    resolver.failing.clear()
+    assert resolver.resolve(["A.B.1", "A.B.2"]) == {"A.B.1": "a.b.1", "A.B.2": "a.b.2"}
+    assert resolver.calls == 2
+
+
+def test_empty_targets_are_not_cached(symbol_cache):
+    class EmptyChainResolver(FakeResolver):
+        @cached_resolution
+        def resolve(self, input_symbols):
+            self.calls += 1
+            return {sym: [] for sym in input_symbols}
+
+    resolver = EmptyChainResolver()
+    resolver.resolve(["LME.CA.1"])
+    resolver.resolve(["LME.CA.1"])
+    assert resolver.calls == 2
+
+
+def test_expired_rows_are_purged_on_open(tmp_path):
+    path = tmp_path / "symbols.sqlite"
+    sc = SymbolCache(path, ttl_seconds=3600)
+    sc.set("fresh", {"A": "a"})
+    sc.set("stale", {"B": "b"})
+    with sc._conn:
+        sc._conn.execute("UPDATE symbol_cache SET ts = ? WHERE key = 'stale'", (time.time() - 7200,))
+
+    reopened = SymbolCache(path, ttl_seconds=3600)
+    keys = [row[0] for row in reopened._conn.execute("SELECT key FROM symbol_cache")]
+    assert keys == ["fresh"]
+    assert reopened.get("fresh") == {"A": "a"}
+
+
+def test_unopenable_cache_falls_back_to_no_cache(tmp_path, monkeypatch):
+    blocker = tmp_path / "not_a_dir"
+    blocker.write_text("")
+    monkeypatch.setattr(cache_module.settings, "symbol_cache_path", str(blocker / "symbols.sqlite"))
+    cache_module.get_symbol_cache.cache_clear()
+    try:
+        assert cache_module.get_symbol_cache() is None
+        assert FakeResolver().resolve(["A.B.1"]) == {"A.B.1": "a.b.1"}
+    finally:
+        cache_module.get_symbol_cache.cache_clear()
+
+
+def test_cache_errors_do_not_break_resolution(symbol_cache, monkeypatch):
+    def broken(*args, **kwargs):
+        raise sqlite3.OperationalError("database is locked")
+
+    monkeypatch.setattr(symbol_cache, "get", broken)
+    monkeypatch.setattr(symbol_cache, "set", broken)
+    assert FakeResolver().resolve(["A.B.1"]) == {"A.B.1": "a.b.1"}
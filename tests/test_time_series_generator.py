@@ -0,0 +1,58 @@
+import os
+
+import pytest
+
+pytest.importorskip("datacore")
+
+from dataflow.config import time_series_generator as tsg
+
+
+@pytest.fixture
+def dashboard(tmp_path, monkeypatch):
+    specs = tmp_path / "specs"
+    specs.mkdir()
+    spec = specs / "futures.yaml"
+    spec.write_text("name: futures\n")
+    os.utime(spec, (1_000, 1_000))
+    output = tmp_path / "time_series.html"
+    monkeypatch.setattr(tsg, "DASHBOARD_INPUTS", ((specs, "*.yaml"),))
+    monkeypatch.setattr(tsg, "HTML_OUTPUT", output)
+    return spec, output
+
+
+def test_html_up_to_date_when_output_newer_than_inputs(dashboard):
+    spec, output = dashboard
+    output.write_text("<html></html>")
+    os.utime(output, (2_000, 2_000))
+
+    assert tsg.html_up_to_date(output)
+
+
+def test_html_stale_when_an_input_is_newer(dashboard):
+    spec, output = dashboard
+    output.write_text("<html></html>")
+    os.utime(output, (2_000, 2_000))
+    os.utime(spec, (3_000, 3_000))
+
+    assert not tsg.html_up_to_date(output)
+
+
+def test_html_stale_when_output_missing(dashboard):
+    spec, output = dashboard
+
+    assert not tsg.html_up_to_date(output)
+
+
+def test_main_skips_up_to_date_html_unless_forced(dashboard, monkeypatch):
+    spec, output = dashboard
+    output.write_text("<html></html>")
+    os.utime(output, (2_000, 2_000))
+    built = []
+    monkeypatch.setattr(tsg, "gen_all_spec", lambda: ["ts"])
+    monkeypatch.setattr(tsg, "time_series_html", lambda time_series, output_path: built.append(output_path))
+
+    tsg.main(["--generate-html"])
+    assert built == []
+
+    tsg.main(["--generate-html", "--force"])
+    assert built == [output]